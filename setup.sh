@@ -42,6 +42,15 @@ pip install --quiet --upgrade pip
 pip install --quiet -r requirements.txt
 echo "✓ Dependencies installed"
 
+# Build optional compiled speedups when Cython is available
+if python -c "import Cython" &> /dev/null; then
+    echo ""
+    echo "Building Cython extensions..."
+    cythonize -i -3 -q src/core/data_extractors/_notes_fast.pyx \
+        && echo "✓ Cython extensions built" \
+        || echo "⚠ Skipped Cython build (the pure-Python version is used)"
+fi
+
 # Done
 echo ""
 echo "================================"
@@ -6,28 +6,211 @@ including the Manifest.db SQLite database that maps hashed filenames
 to their original paths.
 """
 
+import os
+import plistlib
 import sqlite3
+import threading
+import weakref
 from pathlib import Path
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Iterator, Any
 from datetime import datetime
 
-from ..utils.helpers import read_plist, get_device_info, is_valid_backup_folder
-from ..utils.constants import MANIFEST_DB, INFO_PLIST, DOMAINS, DOMAIN_PATHS
+from ..utils.helpers import (
+    read_plist, get_device_info, is_valid_backup_folder, get_file_hash
+)
+from ..utils.constants import (
+    MANIFEST_DB, INFO_PLIST, DOMAINS, DOMAIN_PATHS, MEDIA_EXTENSIONS,
+    FILES_CACHE_MAX_DOMAINS,
+)
 
 
-@dataclass
+# Read-only tuning applied to every Manifest.db connection: a 64 MB page
+# cache, in-memory temp tables and memory-mapped I/O for large Files scans.
+MANIFEST_PRAGMAS = (
+    "cache_size=-65536",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "query_only=1",
+)
+
+# Tuning for the app databases inside the backup (sms.db, AddressBook, ...).
+# They are only ever read, so pin them in a larger cache and map them
+# into memory rather than copying every page through read().
+BACKUP_DB_PRAGMAS = (
+    "mmap_size=1073741824",
+    "cache_size=-131072",
+    "temp_store=MEMORY",
+    "query_only=1",
+)
+
+_plistlib_loads = plistlib.loads
+
+# Size of each connection's prepared statement cache
+STATEMENT_CACHE_SIZE = 256
+
+# Manifest.db connections kept open for reuse after their thread ends
+MANIFEST_IDLE_CONNECTIONS = 2
+
+# SQL used by BackupParser. Keeping the text constant lets the connection's
+# statement cache reuse the prepared statements across calls.
+_FILE_COLUMNS = "SELECT fileID, domain, relativePath, flags, file FROM Files"
+
+_SQL_FILE_BY_ID = f"{_FILE_COLUMNS} WHERE fileID = ?"
+
+_SQL_FILES_BY_DOMAIN = f"{_FILE_COLUMNS} WHERE domain = ?"
+
+_SQL_FILES_BY_PATH_PATTERN = f"{_FILE_COLUMNS} WHERE domain = ? AND relativePath LIKE ?"
+
+_SQL_TOTAL_FILE_COUNT = "SELECT COUNT(*) FROM Files"
+
+_SQL_DOMAIN_STATS = """
+    SELECT domain, COUNT(*) as count
+    FROM Files
+    GROUP BY domain
+    ORDER BY count DESC
+"""
+
+_CAMERA_ROLL_DOMAINS = DOMAINS.get("camera_roll", [])
+_CAMERA_ROLL_PATH_PATTERNS = [f"{prefix}%" for prefix in DOMAIN_PATHS.get("camera_roll", [])]
+_CAMERA_ROLL_EXT_PATTERNS = [f"%{ext}" for ext in sorted(MEDIA_EXTENSIONS)]
+
+# Filter to media files in SQL so sidecars and thumbnails never leave
+# SQLite (LIKE is case-insensitive for ASCII)
+_SQL_CAMERA_ROLL_FILES = "{} WHERE domain IN ({}) AND ({}) AND ({})".format(
+    _FILE_COLUMNS,
+    ",".join("?" * len(_CAMERA_ROLL_DOMAINS)),
+    " OR ".join(["relativePath LIKE ?"] * len(_CAMERA_ROLL_PATH_PATTERNS)),
+    " OR ".join(["relativePath LIKE ?"] * len(_CAMERA_ROLL_EXT_PATTERNS)),
+)
+
+
+def _parse_file_blob(blob: bytes) -> Dict[str, Any]:
+    """
+    Parse the binary plist blob containing file metadata.
+    
+    Args:
+        blob: Binary plist data
+        
+    Returns:
+        Dictionary with file metadata
+    """
+    if not blob:
+        return {}
+    
+    try:
+        data = _plistlib_loads(blob)
+        
+        result = {}
+        if "$objects" in data:
+            # NSKeyedArchiver format - the MBFile fields live on the root
+            # object, so look it up directly and only scan as a fallback
+            objects = data["$objects"]
+            try:
+                root = data["$top"]["root"]
+                root_obj = objects[root if isinstance(root, int) else root.data]
+                candidates = [root_obj] if isinstance(root_obj, dict) else objects
+            except (KeyError, IndexError, TypeError, AttributeError):
+                candidates = objects
+            
+            for obj in candidates:
+                if isinstance(obj, dict):
+                    if "Size" in obj:
+                        result["Size"] = obj["Size"]
+                    if "Mode" in obj:
+                        result["Mode"] = obj["Mode"]
+                    if "LastModified" in obj:
+                        result["LastModified"] = datetime.fromtimestamp(obj["LastModified"])
+                    if "Birth" in obj:
+                        result["Birth"] = datetime.fromtimestamp(obj["Birth"])
+        else:
+            # Direct format
+            result = data
+        
+        return result
+    except Exception:
+        return {}
+
+
+def open_backup_db(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Open an SQLite database stored in the backup for reading.
+    
+    The backup never changes while it is being read, so the database is
+    opened immutable: SQLite skips file locking and change detection.
+    
+    Args:
+        db_path: Path to the database file in the backup folder
+        check_same_thread: Passed through to sqlite3.connect()
+        
+    Returns:
+        Read-only sqlite3 connection
+        
+    Raises:
+        sqlite3.Error: If the database can't be opened
+    """
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=check_same_thread,
+    )
+    for pragma in BACKUP_DB_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
+
+
+class _ConnectionLease:
+    """A thread's hold on a pooled connection, kept in thread-local storage."""
+    
+    __slots__ = ("connection", "__weakref__")
+    
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+
+@dataclass(slots=True)
 class BackupFile:
-    """Represents a file within an iOS backup."""
+    """
+    Represents a file within an iOS backup.
+    
+    The metadata blob from Manifest.db is kept as raw bytes and only
+    decoded the first time size, mode or a timestamp is read.
+    """
     
     file_id: str  # The SHA1 hash filename in backup
     domain: str   # e.g., "CameraRollDomain"
     relative_path: str  # Original path within domain
     flags: int
-    size: int = 0
-    mode: int = 0
-    mtime: Optional[datetime] = None
-    ctime: Optional[datetime] = None
+    file_blob: bytes = field(default=b"", repr=False)  # Raw metadata plist
+    _metadata: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Get the decoded metadata blob (parsed on first access)."""
+        if self._metadata is None:
+            self._metadata = _parse_file_blob(self.file_blob)
+        return self._metadata
+    
+    @property
+    def size(self) -> int:
+        """File size in bytes."""
+        return self.metadata.get("Size", 0)
+    
+    @property
+    def mode(self) -> int:
+        """Unix file mode."""
+        return self.metadata.get("Mode", 0)
+    
+    @property
+    def mtime(self) -> Optional[datetime]:
+        """Last modified date."""
+        return self.metadata.get("LastModified")
+    
+    @property
+    def ctime(self) -> Optional[datetime]:
+        """Creation (birth) date."""
+        return self.metadata.get("Birth")
     
     @property
     def full_path(self) -> str:
@@ -37,12 +220,17 @@ class BackupFile:
     @property
     def filename(self) -> str:
         """Get just the filename from the relative path."""
-        return Path(self.relative_path).name
+        return self.relative_path.rpartition("/")[2]
     
     @property
     def extension(self) -> str:
         """Get the file extension (lowercase)."""
-        return Path(self.relative_path).suffix.lower()
+        # Same rules as Path.suffix, without building a Path per file
+        name = self.filename
+        i = name.rfind(".")
+        if 0 < i < len(name) - 1:
+            return name[i:].lower()
+        return ""
     
     def get_backup_file_path(self, backup_path: Path) -> Path:
         """
@@ -51,10 +239,10 @@ class BackupFile:
         iOS stores files in subdirectories based on first 2 chars of hash.
         e.g., hash "abcdef..." is stored in "ab/abcdef..."
         """
-        return backup_path / self.file_id[:2] / self.file_id
+        return Path(os.path.join(backup_path, self.file_id[:2], self.file_id))
 
 
-@dataclass
+@dataclass(slots=True)
 class Backup:
     """Represents a complete iOS backup."""
     
@@ -67,8 +255,8 @@ class Backup:
     udid: str = ""
     is_encrypted: bool = False
     
-    # Cached file lists by domain
-    _files_cache: Dict[str, List[BackupFile]] = field(default_factory=dict)
+    # Cached file lists by domain (least recently used first)
+    _files_cache: "OrderedDict[str, List[BackupFile]]" = field(default_factory=OrderedDict)
     
     @property
     def display_name(self) -> str:
@@ -109,7 +297,12 @@ class BackupParser:
             backup_path: Path to the iOS backup folder
         """
         self.backup_path = Path(backup_path)
-        self._connection: Optional[sqlite3.Connection] = None
+        self._manifest_uri: Optional[str] = None
+        self._conn_local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._idle_connections: List[sqlite3.Connection] = []
+        self._databases: Dict[Path, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
         self._backup: Optional[Backup] = None
     
     @property
@@ -117,6 +310,98 @@ class BackupParser:
         """Get the parsed backup info."""
         return self._backup
     
+    @property
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Get the Manifest.db connection for the calling thread.
+        
+        Each thread holds its own read-only connection so queries from
+        worker threads can run concurrently. The connection goes back to
+        a small idle pool when the thread ends, so short-lived workers
+        reuse connections instead of leaving one open each. Returns None
+        if the parser is not open.
+        """
+        if self._manifest_uri is None:
+            return None
+        
+        lease = getattr(self._conn_local, "lease", None)
+        if lease is None:
+            try:
+                lease = self._lease(self._checkout())
+            except sqlite3.Error as e:
+                print(f"Error opening Manifest.db: {e}")
+                return None
+        return lease.connection
+    
+    def _lease(self, conn: sqlite3.Connection) -> _ConnectionLease:
+        """Hand a connection to the calling thread until the thread ends."""
+        lease = _ConnectionLease(conn)
+        # Thread-local data is released when its thread finishes, which
+        # returns the connection
+        weakref.finalize(lease, self._checkin, conn)
+        self._conn_local.lease = lease
+        return lease
+    
+    def _checkout(self) -> sqlite3.Connection:
+        """Take an idle Manifest.db connection, or open a new one."""
+        with self._connections_lock:
+            if self._idle_connections:
+                return self._idle_connections.pop()
+        return self._connect()
+    
+    def _checkin(self, conn: sqlite3.Connection):
+        """Take back the connection of a thread that has ended."""
+        with self._connections_lock:
+            if not any(c is conn for c in self._connections):
+                return  # Already closed by close()
+            if len(self._idle_connections) < MANIFEST_IDLE_CONNECTIONS:
+                self._idle_connections.append(conn)
+                return
+            self._connections.remove(conn)
+        conn.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a new read-only Manifest.db connection."""
+        # check_same_thread is off so connections can move between threads
+        # through the idle pool; each is used by one thread at a time
+        conn = sqlite3.connect(
+            self._manifest_uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in MANIFEST_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma}")
+        
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def open_ro_db(self, db_path: Path) -> sqlite3.Connection:
+        """
+        Get the shared connection to a database in the backup.
+        
+        One connection per database is opened with open_backup_db() on
+        first use and shared by every thread (SQLite serializes access to
+        it) until close(), so extractors must not close it.
+        
+        Args:
+            db_path: Path to the database file in the backup folder
+            
+        Returns:
+            Read-only sqlite3 connection
+            
+        Raises:
+            sqlite3.Error: If the database can't be opened
+        """
+        with self._connections_lock:
+            conn = self._databases.get(db_path)
+            if conn is None:
+                conn = open_backup_db(db_path, check_same_thread=False)
+                self._connections.append(conn)
+                self._databases[db_path] = conn
+        return conn
+    
     def open(self) -> bool:
         """
         Open the backup and parse metadata.
@@ -158,18 +443,29 @@ class BackupParser:
         # Open database connection
         try:
             manifest_db = self.backup_path / MANIFEST_DB
-            self._connection = sqlite3.connect(f"file:{manifest_db}?mode=ro", uri=True, check_same_thread=False)
-            self._connection.row_factory = sqlite3.Row
-            return True
+            self._manifest_uri = f"file:{manifest_db}?mode=ro"
+            self._lease(self._connect())
         except sqlite3.Error as e:
             print(f"Error opening Manifest.db: {e}")
+            self._manifest_uri = None
             return False
+        
+        return True
     
     def close(self):
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the database connections of all threads."""
+        if self._manifest_uri is None:
+            return
+        
+        self._manifest_uri = None
+        
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._idle_connections = []
+            self._databases = {}
+        for conn in connections:
+            conn.close()
+        self._conn_local = threading.local()
     
     def __enter__(self):
         """Context manager entry."""
@@ -180,6 +476,49 @@ class BackupParser:
         """Context manager exit."""
         self.close()
     
+    def _iter_files(self, sql: str, params, batch_size: int = 1000) -> Iterator[BackupFile]:
+        """
+        Run a Files query and lazily yield BackupFile objects from its rows.
+        
+        The query must select fileID, domain, relativePath, flags and file
+        in that order. Rows are pulled in batches as plain tuples.
+        
+        Args:
+            sql: SELECT statement over the Files table
+            params: Query parameters
+            batch_size: Number of rows fetched per round trip
+            
+        Yields:
+            BackupFile objects
+        """
+        cursor = self._connection.cursor()
+        cursor.arraysize = batch_size
+        cursor.execute(sql, params)
+        
+        while batch := cursor.fetchmany():
+            for file_id, domain, relative_path, flags, file_blob in batch:
+                yield BackupFile(file_id, domain, relative_path, flags, file_blob)
+    
+    def _query_files(self, sql: str, params) -> List[BackupFile]:
+        """Run a Files query and return all rows as BackupFile objects."""
+        return list(self._iter_files(sql, params))
+    
+    def _get_cached_files(self, domain: str) -> Optional[List[BackupFile]]:
+        """Get a domain's cached files and mark it as recently used."""
+        cache = self._backup._files_cache
+        files = cache.get(domain)
+        if files is not None:
+            cache.move_to_end(domain)
+        return files
+    
+    def _cache_files(self, domain: str, files: List[BackupFile]):
+        """Cache a domain's files, evicting the least recently used domains."""
+        cache = self._backup._files_cache
+        cache[domain] = files
+        cache.move_to_end(domain)
+        while len(cache) > FILES_CACHE_MAX_DOMAINS:
+            cache.popitem(last=False)
+    
     def get_files_by_domain(self, domain: str) -> List[BackupFile]:
         """
         Get all files in a specific domain.
@@ -194,37 +533,16 @@ class BackupParser:
             return []
         
         # Check cache
-        if domain in self._backup._files_cache:
-            return self._backup._files_cache[domain]
+        cached = self._get_cached_files(domain)
+        if cached is not None:
+            return cached
         
         files = []
         try:
-            cursor = self._connection.execute(
-                """
-                SELECT fileID, domain, relativePath, flags, file
-                FROM Files
-                WHERE domain = ?
-                """,
-                (domain,)
-            )
-            
-            for row in cursor:
-                file_metadata = self._parse_file_blob(row["file"])
-                
-                backup_file = BackupFile(
-                    file_id=row["fileID"],
-                    domain=row["domain"],
-                    relative_path=row["relativePath"],
-                    flags=row["flags"],
-                    size=file_metadata.get("Size", 0),
-                    mode=file_metadata.get("Mode", 0),
-                    mtime=file_metadata.get("LastModified"),
-                    ctime=file_metadata.get("Birth"),
-                )
-                files.append(backup_file)
+            files = self._query_files(_SQL_FILES_BY_DOMAIN, (domain,))
             
             # Cache results
-            self._backup._files_cache[domain] = files
+            self._cache_files(domain, files)
             
         except sqlite3.Error as e:
             print(f"Error querying files: {e}")
@@ -241,9 +559,42 @@ class BackupParser:
         Returns:
             Combined list of BackupFile objects
         """
+        if not self._connection:
+            return []
+        
+        results: Dict[str, List[BackupFile]] = {}
+        missing = []
+        for domain in dict.fromkeys(domains):
+            cached = self._get_cached_files(domain)
+            if cached is not None:
+                results[domain] = cached
+            else:
+                missing.append(domain)
+        
+        if missing:
+            # Fetch every uncached domain with a single query
+            fetched: Dict[str, List[BackupFile]] = {d: [] for d in missing}
+            try:
+                placeholders = ",".join("?" * len(missing))
+                files = self._query_files(
+                    f"{_FILE_COLUMNS} WHERE domain IN ({placeholders})",
+                    missing
+                )
+                
+                for backup_file in files:
+                    fetched[backup_file.domain].append(backup_file)
+                
+                # Cache results
+                for domain, domain_files in fetched.items():
+                    self._cache_files(domain, domain_files)
+                results.update(fetched)
+                
+            except sqlite3.Error as e:
+                print(f"Error querying files: {e}")
+        
         all_files = []
         for domain in domains:
-            all_files.extend(self.get_files_by_domain(domain))
+            all_files.extend(results.get(domain, []))
         return all_files
     
     def get_files_by_path_pattern(
@@ -266,35 +617,37 @@ class BackupParser:
         
         files = []
         try:
-            cursor = self._connection.execute(
-                """
-                SELECT fileID, domain, relativePath, flags, file
-                FROM Files
-                WHERE domain = ? AND relativePath LIKE ?
-                """,
-                (domain, path_pattern)
-            )
-            
-            for row in cursor:
-                file_metadata = self._parse_file_blob(row["file"])
-                
-                backup_file = BackupFile(
-                    file_id=row["fileID"],
-                    domain=row["domain"],
-                    relative_path=row["relativePath"],
-                    flags=row["flags"],
-                    size=file_metadata.get("Size", 0),
-                    mode=file_metadata.get("Mode", 0),
-                    mtime=file_metadata.get("LastModified"),
-                    ctime=file_metadata.get("Birth"),
-                )
-                files.append(backup_file)
-                
+            files = self._query_files(_SQL_FILES_BY_PATH_PATTERN, (domain, path_pattern))
         except sqlite3.Error as e:
             print(f"Error querying files: {e}")
         
         return files
     
+    def get_file(self, domain: str, relative_path: str) -> Optional[BackupFile]:
+        """
+        Look up a single file by its exact domain and path.
+        
+        The fileID is SHA1(domain-relativePath), so this is a primary key
+        lookup instead of a LIKE scan over the Files table.
+        
+        Args:
+            domain: Domain of the file (e.g., "HomeDomain")
+            relative_path: Exact path within the domain
+            
+        Returns:
+            BackupFile, or None if the backup doesn't contain the file
+        """
+        if not self._connection:
+            return None
+        
+        try:
+            files = self._query_files(_SQL_FILE_BY_ID, (get_file_hash(domain, relative_path),))
+        except sqlite3.Error as e:
+            print(f"Error querying files: {e}")
+            return None
+        
+        return files[0] if files else None
+    
     def get_camera_roll_files(self) -> List[BackupFile]:
         """
         Get all Camera Roll files (photos and videos).
@@ -302,21 +655,23 @@ class BackupParser:
         Returns:
             List of BackupFile objects for Camera Roll
         """
-        camera_domains = DOMAINS.get("camera_roll", [])
-        all_files = []
-        
-        for domain in camera_domains:
-            # Get files from DCIM paths
-            for path_prefix in DOMAIN_PATHS.get("camera_roll", []):
-                pattern = f"{path_prefix}%"
-                files = self.get_files_by_path_pattern(domain, pattern)
-                all_files.extend(files)
+        if not self._connection:
+            return []
         
-        # Filter to only media files
-        from ..utils.constants import MEDIA_EXTENSIONS
-        media_files = [f for f in all_files if f.extension in MEDIA_EXTENSIONS]
+        # Every Camera Roll domain in one scan
+        try:
+            files = self._query_files(
+                _SQL_CAMERA_ROLL_FILES,
+                [*_CAMERA_ROLL_DOMAINS, *_CAMERA_ROLL_PATH_PATTERNS, *_CAMERA_ROLL_EXT_PATTERNS],
+            )
+        except sqlite3.Error as e:
+            print(f"Error querying files: {e}")
+            return []
         
-        return media_files
+        # Keep the files grouped in DOMAINS order (the sort is stable)
+        domain_order = {domain: i for i, domain in enumerate(_CAMERA_ROLL_DOMAINS)}
+        files.sort(key=lambda backup_file: domain_order[backup_file.domain])
+        return files
     
     def get_total_file_count(self) -> int:
         """Get total number of files in the backup."""
@@ -324,7 +679,7 @@ class BackupParser:
             return 0
         
         try:
-            cursor = self._connection.execute("SELECT COUNT(*) FROM Files")
+            cursor = self._connection.execute(_SQL_TOTAL_FILE_COUNT)
             return cursor.fetchone()[0]
         except sqlite3.Error:
             return 0
@@ -341,56 +696,9 @@ class BackupParser:
         
         stats = {}
         try:
-            cursor = self._connection.execute(
-                """
-                SELECT domain, COUNT(*) as count
-                FROM Files
-                GROUP BY domain
-                ORDER BY count DESC
-                """
-            )
-            for row in cursor:
-                stats[row["domain"]] = row["count"]
+            # Tuple rows let dict() consume the (domain, count) pairs
+            stats = dict(self._connection.execute(_SQL_DOMAIN_STATS))
         except sqlite3.Error as e:
             print(f"Error getting domain stats: {e}")
         
         return stats
-    
-    def _parse_file_blob(self, blob: bytes) -> Dict[str, Any]:
-        """
-        Parse the binary plist blob containing file metadata.
-        
-        Args:
-            blob: Binary plist data
-            
-        Returns:
-            Dictionary with file metadata
-        """
-        if not blob:
-            return {}
-        
-        try:
-            import plistlib
-            data = plistlib.loads(blob)
-            
-            result = {}
-            if "$objects" in data:
-                # NSKeyedArchiver format - extract relevant fields
-                objects = data["$objects"]
-                for obj in objects:
-                    if isinstance(obj, dict):
-                        if "Size" in obj:
-                            result["Size"] = obj["Size"]
-                        if "Mode" in obj:
-                            result["Mode"] = obj["Mode"]
-                        if "LastModified" in obj:
-                            result["LastModified"] = datetime.fromtimestamp(obj["LastModified"])
-                        if "Birth" in obj:
-                            result["Birth"] = datetime.fromtimestamp(obj["Birth"])
-            else:
-                # Direct format
-                result = data
-            
-            return result
-        except Exception:
-            return {}
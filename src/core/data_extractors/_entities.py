@@ -0,0 +1,33 @@
+"""
+HTML entity decoding shared by notes.py and the compiled _notes_fast.
+
+Kept in its own module so _notes_fast doesn't have to import it back
+from a partially initialised notes module.
+"""
+
+import html
+import re
+
+
+# The few entities Notes HTML actually uses, decoded without html.unescape()
+_COMMON_ENTITIES = {
+    "amp": "&",
+    "lt": "<",
+    "gt": ">",
+    "quot": '"',
+    "#39": "'",
+    "nbsp": "\xa0",
+}
+_COMMON_ENTITY_RE = re.compile(r"&(amp|lt|gt|quot|#39|nbsp);")
+
+
+def unescape_entities(text: str) -> str:
+    """Decode HTML entities, with a fast path for the common ones."""
+    if "&" not in text:
+        return text
+    decoded, count = _COMMON_ENTITY_RE.subn(lambda m: _COMMON_ENTITIES[m[1]], text)
+    # Any other "&" needs the full HTML5 rules; decode the original text
+    # so an entity is never decoded twice
+    if count == text.count("&"):
+        return decoded
+    return html.unescape(text)
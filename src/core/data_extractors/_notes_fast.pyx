@@ -0,0 +1,43 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled strip_html for the Notes extractor.
+
+Optional: notes.py falls back to its pure-Python strip_html when this
+module hasn't been built. Build it in place with:
+
+    cythonize -i -3 src/core/data_extractors/_notes_fast.pyx
+"""
+
+from ._entities import unescape_entities
+
+
+cpdef str strip_html(str text):
+    """Strip HTML tags from text."""
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n
+    cdef Py_ssize_t start = 0
+    cdef Py_ssize_t tag_start = 0
+    cdef Py_UCS4 c
+    cdef bint in_tag = False
+    cdef list parts = []
+
+    if not text:
+        return ""
+
+    n = len(text)
+    for i in range(n):
+        c = text[i]
+        if c == u"<":
+            if not in_tag:
+                parts.append(text[start:i])
+                tag_start = i
+                in_tag = True
+        elif c == u">" and in_tag:
+            start = i + 1
+            in_tag = False
+
+    # An unterminated tag is kept as text, like the pure-Python version
+    parts.append(text[tag_start:] if in_tag else text[start:])
+
+    # Decode HTML entities (after stripping, so "&lt;" stays literal text)
+    return unescape_entities("".join(parts)).strip()
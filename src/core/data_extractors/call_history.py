@@ -5,11 +5,12 @@ This module handles extracting call history from the CallHistory.storedata
 or call_history.db database in iOS backups.
 """
 
+import csv
 import sqlite3
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..backup_parser import BackupParser, BackupFile
 
@@ -23,14 +24,14 @@ def apple_timestamp_to_datetime(timestamp: float) -> Optional[datetime]:
     if not timestamp:
         return None
     try:
-        # Core Data timestamps are seconds since 2001-01-01
-        delta = datetime.fromtimestamp(0) - APPLE_EPOCH
-        return datetime.fromtimestamp(timestamp) - delta
-    except (ValueError, OSError):
+        # Core Data timestamps are seconds since 2001-01-01; plain
+        # arithmetic avoids two fromtimestamp() calls per row
+        return APPLE_EPOCH + timedelta(seconds=timestamp)
+    except (ValueError, OverflowError):
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class CallRecord:
     """Represents a phone call record."""
     
@@ -50,7 +51,7 @@ class CallRecord:
     def date_formatted(self) -> str:
         """Get formatted date string."""
         if self.date:
-            return self.date.strftime("%Y-%m-%d %H:%M")
+            return self.date.isoformat(" ", "minutes")
         return ""
     
     @property
@@ -129,7 +130,12 @@ class CallHistoryExtractor:
         ]
         
         for domain, path in search_patterns:
-            files = self.parser.get_files_by_path_pattern(domain, f"%{path.split('/')[-1]}")
+            # Exact path first (primary key lookup), then a filename match
+            backup_file = self.parser.get_file(domain, path)
+            if backup_file:
+                files = [backup_file]
+            else:
+                files = self.parser.get_files_by_path_pattern(domain, f"%{path.split('/')[-1]}")
             if files:
                 self._db_path = files[0].get_backup_file_path(self.backup_path)
                 if self._db_path.exists():
@@ -155,10 +161,9 @@ class CallHistoryExtractor:
         calls = []
         
         try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            conn.row_factory = sqlite3.Row
+            conn = self.parser.open_ro_db(db_path)
             
-            # Try modern CallHistory.storedata schema first
+            # Rows come back as plain tuples in the column order below
             try:
                 cursor = conn.execute("""
                     SELECT 
@@ -172,16 +177,17 @@ class CallHistoryExtractor:
                     ORDER BY ZDATE DESC
                 """)
                 
-                for row in cursor:
-                    call = CallRecord(
-                        id=row["id"],
-                        address=row["address"] or "",
-                        date=apple_timestamp_to_datetime(row["date"]),
-                        duration=int(row["duration"] or 0),
-                        call_type=row["call_type"] or 0,
-                        answered=bool(row["answered"]),
+                calls = [
+                    CallRecord(
+                        call_id,
+                        address or "",
+                        apple_timestamp_to_datetime(date),
+                        int(duration or 0),
+                        call_type or 0,
+                        bool(answered),
                     )
-                    calls.append(call)
+                    for call_id, address, date, duration, call_type, answered in cursor.fetchall()
+                ]
                     
             except sqlite3.OperationalError:
                 # Fall back to legacy schema
@@ -197,26 +203,23 @@ class CallHistoryExtractor:
                     ORDER BY date DESC
                 """)
                 
-                for row in cursor:
+                for call_id, address, date, duration, call_type, answered in cursor.fetchall():
                     # Legacy dates are Unix timestamps
                     call_date = None
-                    if row["date"]:
+                    if date:
                         try:
-                            call_date = datetime.fromtimestamp(row["date"])
+                            call_date = datetime.fromtimestamp(date)
                         except (ValueError, OSError):
                             pass
                     
-                    call = CallRecord(
-                        id=row["id"],
-                        address=row["address"] or "",
-                        date=call_date,
-                        duration=int(row["duration"] or 0),
-                        call_type=row["call_type"] or 0,
-                        answered=bool(row["answered"]),
-                    )
-                    calls.append(call)
-            
-            conn.close()
+                    calls.append(CallRecord(
+                        call_id,
+                        address or "",
+                        call_date,
+                        int(duration or 0),
+                        call_type or 0,
+                        bool(answered),
+                    ))
             
         except sqlite3.Error as e:
             print(f"Error reading call history database: {e}")
@@ -224,14 +227,33 @@ class CallHistoryExtractor:
         self._calls = calls
         return self._calls
     
+    def get_all_with_stats(self) -> Tuple[List[CallRecord], Dict[str, Any]]:
+        """
+        Get all calls together with their statistics.
+        
+        The stats are counted from the loaded calls.
+        
+        Returns:
+            (calls, stats dict)
+        """
+        calls = self.get_all_calls()
+        return calls, self.get_stats()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about call history."""
         calls = self.get_all_calls()
         
-        incoming = sum(1 for c in calls if c.call_type == 1)
-        outgoing = sum(1 for c in calls if c.call_type == 2)
-        missed = sum(1 for c in calls if c.call_type == 3)
-        total_duration = sum(c.duration for c in calls)
+        # Single pass over the records
+        incoming = outgoing = missed = total_duration = 0
+        for call in calls:
+            total_duration += call.duration
+            call_type = call.call_type
+            if call_type == 1:
+                incoming += 1
+            elif call_type == 2:
+                outgoing += 1
+            elif call_type == 3:
+                missed += 1
         
         return {
             "total_calls": len(calls),
@@ -271,9 +293,7 @@ class CallHistoryExtractor:
             return False
         
         try:
-            import csv
-            
-            with open(destination, "w", newline="", encoding="utf-8") as f:
+            with open(destination, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 
                 # Header
@@ -286,14 +306,16 @@ class CallHistoryExtractor:
                 ])
                 
                 # Data
-                for call in calls:
-                    writer.writerow([
+                writer.writerows(
+                    (
                         call.date_formatted,
                         call.phone_number,
                         call.call_type_name,
                         call.duration_formatted,
                         "Yes" if call.answered else "No"
-                    ])
+                    )
+                    for call in calls
+                )
             
             return True
         except Exception as e:
@@ -5,18 +5,179 @@ This module handles extracting Camera Roll media files from iOS backups,
 preserving original filenames and maintaining proper file extensions.
 """
 
+import ctypes
+import errno
+import os
 import shutil
+import sys
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Callable, Generator
+from typing import List, Optional, Callable, Generator, BinaryIO, Iterator, Tuple
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from ..backup_parser import BackupParser, BackupFile
-from ...utils.constants import MEDIA_EXTENSIONS, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
-from ...utils.helpers import format_file_size, ensure_dir, sanitize_filename
+from ...utils.constants import MEDIA_EXTENSIONS, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, CHUNK_SIZE
+from ...utils.helpers import format_file_size, ensure_dir, sanitize_filename, get_export_workers
+
+
+# Linux ioctl that makes dst share src's extents (Btrfs, XFS, ...)
+_FICLONE = 0x40049409
+
+# Errors meaning "this copy method isn't supported here", so try the next one
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.ENOTTY, errno.EBADF, errno.EPERM,
+}
+
+# macOS clonefile(2): copy-on-write clone on APFS. copyfile(3) handles
+# other volumes (and existing destinations) in the kernel with fcopyfile.
+_clonefile = None
+_copyfile = None
+_COPYFILE_ALL = 0xF  # ACL | STAT | XATTR | DATA
+if sys.platform == "darwin":
+    try:
+        _libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        _clonefile = _libsystem.clonefile
+        _clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+        _clonefile.restype = ctypes.c_int
+        _copyfile = _libsystem.copyfile
+        _copyfile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_void_p, ctypes.c_uint32]
+        _copyfile.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clonefile = None
+        _copyfile = None
+
+# One reusable CHUNK_SIZE buffer per thread for the buffered fallback
+_copy_buffers = threading.local()
+
+
+def _copy_buffer() -> memoryview:
+    """Get this thread's copy buffer, allocating it on first use."""
+    view = getattr(_copy_buffers, "view", None)
+    if view is None:
+        view = _copy_buffers.view = memoryview(bytearray(CHUNK_SIZE))
+    return view
+
+
+def _copy_fileobj(fsrc: BinaryIO, fdst: BinaryIO):
+    """
+    Copy file contents using the cheapest method the platform supports.
+    
+    Tries a reflink clone, then copy_file_range and sendfile (all of which
+    stay in the kernel), and finally a buffered read/write loop. Data is
+    moved in CHUNK_SIZE steps, and the source is dropped from the page
+    cache afterwards so large video exports don't evict everything else.
+    """
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+    
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+    
+    size = os.fstat(src_fd).st_size
+    has_fadvise = hasattr(os, "posix_fadvise")
+    if has_fadvise:
+        os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    try:
+        _copy_data(fsrc, fdst, size)
+    finally:
+        if has_fadvise:
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _copy_data(fsrc: BinaryIO, fdst: BinaryIO, size: int):
+    """Copy size bytes between two open files, in-kernel when possible."""
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+    
+    if hasattr(os, "copy_file_range"):
+        offset = 0
+        try:
+            while offset < size:
+                copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+            if offset >= size:
+                return
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+    
+    # sendfile() to a regular file is only supported on Linux
+    if sys.platform.startswith("linux"):
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, min(CHUNK_SIZE, size - offset))
+                if sent == 0:
+                    break
+                offset += sent
+            if offset >= size:
+                return
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+    
+    # Start over with a plain copy
+    fsrc.seek(0)
+    fdst.seek(0)
+    fdst.truncate()
+    view = _copy_buffer()
+    while n := fsrc.readinto(view):
+        fdst.write(view[:n])
+
+
+def _fast_copy(src: Path, dst: Path):
+    """
+    Copy a file with shutil.copy2 semantics, preferring zero-copy clones.
+    
+    On APFS (macOS) and reflink-capable Linux filesystems the copy is a
+    metadata-only clone; otherwise the data is copied in-kernel where
+    possible. File metadata is copied afterwards like copy2 does.
+    
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    if _clonefile is not None:
+        src_bytes = os.fsencode(src)
+        dst_bytes = os.fsencode(dst)
+        
+        # The clone carries the source metadata; pin timestamps like copy2 does
+        if _clonefile(src_bytes, dst_bytes, 0) == 0:
+            st = os.stat(src)
+            os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+            return
+        
+        # Cross-volume, non-APFS or existing destination
+        if _copyfile(src_bytes, dst_bytes, None, _COPYFILE_ALL) == 0:
+            return
+    
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        _copy_fileobj(fsrc, fdst)
+    shutil.copystat(src, dst)
+
 
+def _newest_first_key(media_file: "MediaFile") -> datetime:
+    """Sort key for media by modified date; undated files sort last."""
+    return media_file.backup_file.mtime or datetime.min
 
-@dataclass
+
+@dataclass(slots=True)
 class MediaFile:
     """Represents a media file from Camera Roll."""
     
@@ -92,7 +253,7 @@ class MediaFile:
             return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportProgress:
     """Progress information for export operation."""
     
@@ -101,6 +262,7 @@ class ExportProgress:
     current_file: str
     bytes_copied: int
     total_bytes: int
+    successful: int = 0
     
     @property
     def percentage(self) -> float:
@@ -136,13 +298,34 @@ class CameraRollExtractor:
             parser: BackupParser instance (must be opened)
         """
         self.parser = parser
+        self._backup_files: Optional[List[BackupFile]] = None
         self._media_files: Optional[List[MediaFile]] = None
+        # Positions of photos/videos in _media_files, filled in alongside it
+        self._photo_indices = array("I")
+        self._video_indices = array("I")
     
     @property
     def backup_path(self) -> Path:
         """Get the backup path."""
         return self.parser.backup_path
     
+    def _get_backup_files(self) -> List[BackupFile]:
+        """
+        Get the Camera Roll manifest entries, excluding directories.
+        
+        Unsorted and not wrapped in MediaFile, for callers that only need
+        counts and sizes.
+        
+        Returns:
+            List of BackupFile objects
+        """
+        if self._backup_files is None:
+            self._backup_files = [
+                bf for bf in self.parser.get_camera_roll_files()
+                if bf.flags != 2  # flags=2 indicates directory
+            ]
+        return self._backup_files
+    
     def get_all_media(self) -> List[MediaFile]:
         """
         Get all Camera Roll media files.
@@ -153,49 +336,79 @@ class CameraRollExtractor:
         if self._media_files is not None:
             return self._media_files
         
-        backup_files = self.parser.get_camera_roll_files()
-        
+        backup_path = self.backup_path
         self._media_files = [
-            MediaFile(backup_file=bf, backup_path=self.backup_path)
-            for bf in backup_files
-            if bf.flags != 2  # flags=2 indicates directory
+            MediaFile(backup_file=bf, backup_path=backup_path)
+            for bf in self._get_backup_files()
         ]
         
         # Sort by modified date (newest first)
-        self._media_files.sort(
-            key=lambda x: x.modified_date or datetime.min,
-            reverse=True
-        )
+        self._media_files.sort(key=_newest_first_key, reverse=True)
+        
+        # Partition once so filters don't re-walk the list
+        photo_indices = self._photo_indices = array("I")
+        video_indices = self._video_indices = array("I")
+        for i, media_file in enumerate(self._media_files):
+            extension = media_file.extension
+            if extension in IMAGE_EXTENSIONS:
+                photo_indices.append(i)
+            if extension in VIDEO_EXTENSIONS:
+                video_indices.append(i)
         
         return self._media_files
     
     def get_photos(self) -> List[MediaFile]:
         """Get only image files."""
-        return [f for f in self.get_all_media() if f.is_image]
+        media = self.get_all_media()
+        return [media[i] for i in self._photo_indices]
     
     def get_videos(self) -> List[MediaFile]:
         """Get only video files."""
-        return [f for f in self.get_all_media() if f.is_video]
+        media = self.get_all_media()
+        return [media[i] for i in self._video_indices]
+    
+    def get_all_with_stats(self) -> Tuple[List[MediaFile], dict]:
+        """
+        Get all media files together with their statistics.
+        
+        The stats come from the same cached manifest entries, so the
+        Manifest.db query runs once.
+        
+        Returns:
+            (media, stats dict)
+        """
+        media = self.get_all_media()
+        return media, self.get_stats()
     
     def get_stats(self) -> dict:
         """
         Get statistics about Camera Roll.
         
+        Works on the raw manifest entries, so no MediaFile objects are
+        built or sorted just to count them.
+        
         Returns:
             Dictionary with counts and sizes
         """
-        all_media = self.get_all_media()
-        photos = self.get_photos()
-        videos = self.get_videos()
+        backup_files = self._get_backup_files()
         
-        total_size = sum(f.size for f in all_media)
-        photo_size = sum(f.size for f in photos)
-        video_size = sum(f.size for f in videos)
+        total_size = photo_size = video_size = 0
+        photo_count = video_count = 0
+        for bf in backup_files:
+            size = bf.size
+            extension = bf.extension
+            total_size += size
+            if extension in IMAGE_EXTENSIONS:
+                photo_count += 1
+                photo_size += size
+            if extension in VIDEO_EXTENSIONS:
+                video_count += 1
+                video_size += size
         
         return {
-            "total_count": len(all_media),
-            "photo_count": len(photos),
-            "video_count": len(videos),
+            "total_count": len(backup_files),
+            "photo_count": photo_count,
+            "video_count": video_count,
             "total_size": total_size,
             "total_size_formatted": format_file_size(total_size),
             "photo_size": photo_size,
@@ -235,53 +448,39 @@ class CameraRollExtractor:
         if not files:
             return 0
         
-        # Ensure destination exists
-        ensure_dir(destination)
+        progress = None
+        for progress in self._export_iter(files, destination):
+            yield progress
+            if progress_callback:
+                progress_callback(progress)
         
-        total_files = len(files)
-        total_bytes = sum(f.size for f in files)
-        bytes_copied = 0
-        successful = 0
+        return progress.successful if progress else 0
+    
+    def iter_export_files(
+        self,
+        files: List[MediaFile],
+        destination: Path,
+    ) -> Generator[ExportProgress, None, int]:
+        """
+        Export specific files to destination, yielding progress.
         
-        # Track filenames to handle duplicates
-        used_names: dict = {}
+        Closing the generator early stops the export.
         
-        for i, media_file in enumerate(files):
-            # Generate unique filename
-            filename = sanitize_filename(media_file.filename)
-            if filename in used_names:
-                used_names[filename] += 1
-                name_part = Path(filename).stem
-                ext = Path(filename).suffix
-                filename = f"{name_part}_{used_names[filename]}{ext}"
-            else:
-                used_names[filename] = 0
-            
-            dest_path = destination / filename
+        Args:
+            files: List of MediaFile objects to export
+            destination: Destination folder path
             
-            progress = ExportProgress(
-                current=i + 1,
-                total=total_files,
-                current_file=filename,
-                bytes_copied=bytes_copied,
-                total_bytes=total_bytes,
-            )
+        Yields:
+            ExportProgress objects
             
+        Returns:
+            Number of successfully exported files
+        """
+        progress = None
+        for progress in self._export_iter(files, destination):
             yield progress
-            
-            if progress_callback:
-                progress_callback(progress)
-            
-            # Copy file
-            try:
-                if media_file.exists():
-                    shutil.copy2(media_file.source_path, dest_path)
-                    bytes_copied += media_file.size
-                    successful += 1
-            except Exception as e:
-                print(f"Error copying {filename}: {e}")
         
-        return successful
+        return progress.successful if progress else 0
     
     def export_files(
         self,
@@ -300,46 +499,139 @@ class CameraRollExtractor:
         Returns:
             Number of successfully exported files
         """
+        progress = None
+        for progress in self._export_iter(files, destination):
+            if progress_callback:
+                progress_callback(progress)
+        
+        return progress.successful if progress else 0
+    
+    def _plan_export(
+        self,
+        files: List[MediaFile],
+        destination: Path,
+    ) -> List[Tuple[MediaFile, str, Path]]:
+        """
+        Pick a unique destination filename for each file.
+        
+        Done serially before any copying starts so duplicate names are
+        resolved the same way regardless of copy order. Names are compared
+        casefolded (the default macOS filesystem is case-insensitive), and
+        a generated "_N" name is itself checked, so no two copies ever
+        share a destination.
+        
+        Args:
+            files: Files to export
+            destination: Destination folder path
+            
+        Returns:
+            List of (media file, filename, destination path) tuples
+        """
+        plan = []
+        used_names = set()
+        next_suffix: dict = {}
+        
+        for media_file in files:
+            filename = sanitize_filename(media_file.filename)
+            key = filename.casefold()
+            if key in used_names:
+                name_part, ext = os.path.splitext(filename)
+                suffix = next_suffix.get(key, 1)
+                while f"{name_part}_{suffix}{ext}".casefold() in used_names:
+                    suffix += 1
+                next_suffix[key] = suffix + 1
+                filename = f"{name_part}_{suffix}{ext}"
+            used_names.add(filename.casefold())
+            
+            plan.append((media_file, filename, destination / filename))
+        
+        return plan
+    
+    @staticmethod
+    def _copy_media(media_file: MediaFile, dest_path: Path) -> bool:
+        """Copy one file out of the backup, returning False if it's missing."""
+        if not media_file.exists():
+            return False
+        _fast_copy(media_file.source_path, dest_path)
+        return True
+    
+    def _copy_on_pool(
+        self,
+        plan: List[Tuple[MediaFile, str, Path]],
+    ) -> Iterator[Tuple[MediaFile, str, bool, Optional[Exception]]]:
+        """
+        Copy planned files on a thread pool.
+        
+        Closing the generator early cancels copies that haven't started.
+        
+        Args:
+            plan: Output of _plan_export
+            
+        Yields:
+            (media file, filename, copied, error) as each copy finishes
+        """
+        executor = ThreadPoolExecutor(max_workers=get_export_workers())
+        try:
+            futures = {
+                executor.submit(self._copy_media, media_file, dest_path): (media_file, filename)
+                for media_file, filename, dest_path in plan
+            }
+            
+            for future in as_completed(futures):
+                media_file, filename = futures[future]
+                try:
+                    yield media_file, filename, future.result(), None
+                except Exception as e:
+                    yield media_file, filename, False, e
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _export_iter(
+        self,
+        files: List[MediaFile],
+        destination: Path,
+    ) -> Generator[ExportProgress, None, None]:
+        """
+        Copy files concurrently, yielding progress as each one finishes.
+        
+        Copies run on a thread pool. Closing the generator early stops
+        copying.
+        
+        Args:
+            files: Files to export
+            destination: Destination folder path
+            
+        Yields:
+            ExportProgress after each completed file
+        """
         if not files:
-            return 0
+            return
         
         ensure_dir(destination)
         
-        total_files = len(files)
+        plan = self._plan_export(files, destination)
+        total_files = len(plan)
         total_bytes = sum(f.size for f in files)
         bytes_copied = 0
         successful = 0
         
-        used_names: dict = {}
+        completed = self._copy_on_pool(plan)
         
-        for i, media_file in enumerate(files):
-            filename = sanitize_filename(media_file.filename)
-            if filename in used_names:
-                used_names[filename] += 1
-                name_part = Path(filename).stem
-                ext = Path(filename).suffix
-                filename = f"{name_part}_{used_names[filename]}{ext}"
-            else:
-                used_names[filename] = 0
-            
-            dest_path = destination / filename
-            
-            if progress_callback:
-                progress = ExportProgress(
-                    current=i + 1,
+        try:
+            for done, (media_file, filename, copied, error) in enumerate(completed, 1):
+                if error is not None:
+                    print(f"Error copying {filename}: {error}")
+                elif copied:
+                    bytes_copied += media_file.size
+                    successful += 1
+                
+                yield ExportProgress(
+                    current=done,
                     total=total_files,
                     current_file=filename,
                     bytes_copied=bytes_copied,
                     total_bytes=total_bytes,
+                    successful=successful,
                 )
-                progress_callback(progress)
-            
-            try:
-                if media_file.exists():
-                    shutil.copy2(media_file.source_path, dest_path)
-                    bytes_copied += media_file.size
-                    successful += 1
-            except Exception as e:
-                print(f"Error copying {filename}: {e}")
-        
-        return successful
+        finally:
+            completed.close()
@@ -6,15 +6,47 @@ database in iOS backups.
 """
 
 import sqlite3
+import threading
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..backup_parser import BackupParser, BackupFile
-from ...utils.helpers import format_file_size, sanitize_filename
+from ...utils.helpers import format_file_size, sanitize_filename, export_unique_files
 
 
-@dataclass
+# Separates values in the GROUP_CONCAT'd phone/email columns (ASCII unit separator)
+_LIST_SEPARATOR = "\x1f"
+
+# Per-thread encode buffer for export_all_vcards
+_vcard_buffers = threading.local()
+
+# Bytes buffered before writing to a combined .vcf file
+_VCF_FLUSH_SIZE = 64 * 1024
+
+# ABMultiValue properties: 3 = phone number, 4 = email
+_SQL_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM ABPerson),
+        (SELECT COUNT(DISTINCT mv.record_id) FROM ABMultiValue mv
+         JOIN ABPerson p ON p.ROWID = mv.record_id
+         WHERE mv.property = 3 AND mv.value IS NOT NULL),
+        (SELECT COUNT(DISTINCT mv.record_id) FROM ABMultiValue mv
+         JOIN ABPerson p ON p.ROWID = mv.record_id
+         WHERE mv.property = 4 AND mv.value IS NOT NULL)
+"""
+
+_SQL_CONTACTS = """
+    SELECT p.First, p.Last, p.Organization, p.Note,
+           GROUP_CONCAT(CASE WHEN mv.property = 3 THEN mv.value END, CHAR(31)),
+           GROUP_CONCAT(CASE WHEN mv.property = 4 THEN mv.value END, CHAR(31))
+    FROM ABPerson p
+    LEFT JOIN ABMultiValue mv ON mv.record_id = p.ROWID AND mv.property IN (3, 4)
+    GROUP BY p.ROWID
+"""
+
+
+@dataclass(slots=True)
 class Contact:
     """Represents a contact from the Address Book."""
     
@@ -25,6 +57,9 @@ class Contact:
     emails: List[str] = None
     notes: str = ""
     
+    # Fixed vCard 3.0 preamble, up to the N: field value
+    _VCARD_HEADER = b"BEGIN:VCARD\nVERSION:3.0\nN:"
+    
     def __post_init__(self):
         if self.phone_numbers is None:
             self.phone_numbers = []
@@ -55,32 +90,44 @@ class Contact:
         """Get primary email."""
         return self.emails[0] if self.emails else ""
     
-    def to_vcard(self) -> str:
-        """Export contact as vCard 3.0 format."""
-        lines = [
-            "BEGIN:VCARD",
-            "VERSION:3.0",
-            f"N:{self.last_name};{self.first_name};;;",
-            f"FN:{self.full_name}",
-        ]
+    def write_vcard(self, buf: bytearray):
+        """
+        Append this contact as UTF-8 encoded vCard 3.0 to a buffer.
+        
+        Args:
+            buf: Buffer to append to
+        """
+        buf += self._VCARD_HEADER
+        buf += self.last_name.encode("utf-8")
+        buf += b";"
+        buf += self.first_name.encode("utf-8")
+        buf += b";;;\nFN:"
+        buf += self.full_name.encode("utf-8")
         
         if self.organization:
-            lines.append(f"ORG:{self.organization}")
+            buf += b"\nORG:"
+            buf += self.organization.encode("utf-8")
         
         for phone in self.phone_numbers:
-            lines.append(f"TEL;TYPE=CELL:{phone}")
+            buf += b"\nTEL;TYPE=CELL:"
+            buf += phone.encode("utf-8")
         
         for email in self.emails:
-            lines.append(f"EMAIL:{email}")
+            buf += b"\nEMAIL:"
+            buf += email.encode("utf-8")
         
         if self.notes:
             # Escape newlines in notes
-            escaped_notes = self.notes.replace("\n", "\\n")
-            lines.append(f"NOTE:{escaped_notes}")
-        
-        lines.append("END:VCARD")
+            buf += b"\nNOTE:"
+            buf += self.notes.replace("\n", "\\n").encode("utf-8")
         
-        return "\n".join(lines)
+        buf += b"\nEND:VCARD"
+    
+    def to_vcard(self) -> str:
+        """Export contact as vCard 3.0 format."""
+        buf = bytearray()
+        self.write_vcard(buf)
+        return buf.decode("utf-8")
 
 
 class ContactsExtractor:
@@ -141,47 +188,22 @@ class ContactsExtractor:
         contacts = []
         
         try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            conn.row_factory = sqlite3.Row
-            
-            # Get all persons
-            cursor = conn.execute("""
-                SELECT ROWID, First, Last, Organization, Note
-                FROM ABPerson
-            """)
-            
-            persons = {row["ROWID"]: Contact(
-                first_name=row["First"] or "",
-                last_name=row["Last"] or "",
-                organization=row["Organization"] or "",
-                notes=row["Note"] or "",
-            ) for row in cursor}
-            
-            # Get phone numbers
-            cursor = conn.execute("""
-                SELECT record_id, value
-                FROM ABMultiValue
-                WHERE property = 3
-            """)
-            
-            for row in cursor:
-                if row["record_id"] in persons:
-                    persons[row["record_id"]].phone_numbers.append(row["value"])
-            
-            # Get emails
-            cursor = conn.execute("""
-                SELECT record_id, value
-                FROM ABMultiValue
-                WHERE property = 4
-            """)
-            
-            for row in cursor:
-                if row["record_id"] in persons:
-                    persons[row["record_id"]].emails.append(row["value"])
+            conn = self.parser.open_ro_db(db_path)
             
-            conn.close()
+            # One row per person, with phones and emails folded in by SQLite
+            cursor = conn.execute(_SQL_CONTACTS)
             
-            contacts = list(persons.values())
+            contacts = [
+                Contact(
+                    first_name=first or "",
+                    last_name=last or "",
+                    organization=organization or "",
+                    notes=note or "",
+                    phone_numbers=phones.split(_LIST_SEPARATOR) if phones else [],
+                    emails=emails.split(_LIST_SEPARATOR) if emails else [],
+                )
+                for first, last, organization, note, phones, emails in cursor
+            ]
             
             # Sort by name
             contacts.sort(key=lambda c: c.display_name.lower())
@@ -192,15 +214,42 @@ class ContactsExtractor:
         self._contacts = contacts
         return self._contacts
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about contacts."""
+    def get_all_with_stats(self) -> Tuple[List[Contact], Dict[str, Any]]:
+        """
+        Get all contacts together with their statistics.
+        
+        The stats are counted from the loaded contacts, so the database is
+        only read once.
+        
+        Returns:
+            (contacts, stats dict)
+        """
         contacts = self.get_all_contacts()
+        return contacts, self.get_stats()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about contacts.
         
-        with_phones = sum(1 for c in contacts if c.phone_numbers)
-        with_emails = sum(1 for c in contacts if c.emails)
+        Counted by SQLite unless the contacts are already loaded.
+        """
+        if self._contacts is not None:
+            contacts = self._contacts
+            total_count = len(contacts)
+            with_phones = sum(1 for c in contacts if c.phone_numbers)
+            with_emails = sum(1 for c in contacts if c.emails)
+        else:
+            total_count = with_phones = with_emails = 0
+            db_path = self._find_addressbook_db()
+            if db_path and db_path.exists():
+                try:
+                    conn = self.parser.open_ro_db(db_path)
+                    total_count, with_phones, with_emails = conn.execute(_SQL_STATS).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Error reading contacts database: {e}")
         
         return {
-            "total_count": len(contacts),
+            "total_count": total_count,
             "with_phones": with_phones,
             "with_emails": with_emails,
         }
@@ -222,22 +271,38 @@ class ContactsExtractor:
         
         destination.mkdir(parents=True, exist_ok=True)
         
-        successful = 0
-        for contact in contacts:
-            filename = f"{contact.display_name}.vcf"
-            # Sanitize filename
-            filename = sanitize_filename(filename)
-            
-            filepath = destination / filename
+        return export_unique_files(
+            contacts,
+            lambda contact: sanitize_filename(f"{contact.display_name}.vcf"),
+            lambda contact, filename: self._write_vcard_file(contact, destination / filename),
+        )
+    
+    @staticmethod
+    def _write_vcard_file(contact: Contact, filepath: Path) -> bool:
+        """
+        Write one contact to its own .vcf file.
+        
+        Args:
+            contact: Contact to write
+            filepath: Destination file path
             
-            try:
-                with open(filepath, "w", encoding="utf-8") as f:
-                    f.write(contact.to_vcard())
-                successful += 1
-            except Exception as e:
-                print(f"Error exporting {filename}: {e}")
+        Returns:
+            True if successful
+        """
+        # Reused for every contact on this thread instead of one per file
+        buf = getattr(_vcard_buffers, "buf", None)
+        if buf is None:
+            buf = _vcard_buffers.buf = bytearray()
         
-        return successful
+        try:
+            buf.clear()
+            contact.write_vcard(buf)
+            with open(filepath, "wb") as f:
+                f.write(buf)
+            return True
+        except Exception as e:
+            print(f"Error exporting {filepath.name}: {e}")
+            return False
     
     def export_all_single_vcf(self, destination: Path) -> bool:
         """
@@ -255,11 +320,18 @@ class ContactsExtractor:
             return False
         
         try:
-            vcards = [c.to_vcard() for c in contacts]
-            content = "\n".join(vcards)
-            
-            with open(destination, "w", encoding="utf-8") as f:
-                f.write(content)
+            # Encode straight into a small buffer and stream it out, rather
+            # than joining every vCard into one big string first
+            buf = bytearray()
+            with open(destination, "wb") as f:
+                for i, contact in enumerate(contacts):
+                    if i:
+                        buf += b"\n"
+                    contact.write_vcard(buf)
+                    if len(buf) >= _VCF_FLUSH_SIZE:
+                        f.write(buf)
+                        buf.clear()
+                f.write(buf)
             
             return True
         except Exception as e:
@@ -6,20 +6,69 @@ database in iOS backups.
 """
 
 import sqlite3
+import sys
+from array import array
+from itertools import chain, groupby
+from operator import itemgetter
 from pathlib import Path
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Iterator, Iterable, Tuple
 
 from ..backup_parser import BackupParser, BackupFile
-from ...utils.helpers import format_file_size, sanitize_filename
+from ...utils.helpers import format_file_size, sanitize_filename, export_unique_files
 
 
 # iOS uses a different epoch (2001-01-01) for dates
 APPLE_EPOCH = datetime(2001, 1, 1)
 
+# Separates participant handles in the GROUP_CONCAT'd column (ASCII unit separator)
+_LIST_SEPARATOR = "\x1f"
 
-def apple_timestamp_to_datetime(timestamp: int) -> Optional[datetime]:
+# Message rows fetched per round trip from SQLite
+_FETCH_BATCH_SIZE = 10000
+
+# Same counts get_stats would derive from get_all_chats
+_SQL_STATS = """
+    SELECT
+        (SELECT COUNT(*) FROM chat),
+        COUNT(*),
+        COALESCE(SUM(m.service = 'iMessage'), 0)
+    FROM message m
+    JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
+    JOIN chat c ON c.ROWID = cmj.chat_id
+"""
+
+# Chats with their participant handles joined in by SQLite
+_SQL_CHATS = """
+    WITH participants AS (
+        SELECT chj.chat_id, GROUP_CONCAT(h.id, CHAR(31)) AS handles
+        FROM chat_handle_join chj
+        JOIN handle h ON h.ROWID = chj.handle_id
+        GROUP BY chj.chat_id
+    )
+    SELECT c.ROWID, c.display_name, c.chat_identifier, participants.handles
+    FROM chat c
+    LEFT JOIN participants ON participants.chat_id = c.ROWID
+"""
+
+# Messages grouped by chat, oldest first; dates may be in seconds or nanoseconds.
+# NULLs are replaced in SQL so rows can go straight into Chat's columns.
+_SQL_MESSAGES = """
+    SELECT
+        cmj.chat_id,
+        COALESCE(m.text, ''),
+        COALESCE(CASE WHEN m.date > 1000000000000 THEN m.date / 1e9 ELSE m.date END, 0),
+        COALESCE(m.is_from_me, 0),
+        COALESCE(m.handle_id, 0),
+        COALESCE(m.service, '')
+    FROM message m
+    JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
+    ORDER BY cmj.chat_id, m.date, m.ROWID
+"""
+
+
+def apple_timestamp_to_datetime(timestamp: float) -> Optional[datetime]:
     """Convert Apple timestamp to datetime."""
     if not timestamp:
         return None
@@ -27,13 +76,12 @@ def apple_timestamp_to_datetime(timestamp: int) -> Optional[datetime]:
         # Timestamps can be in nanoseconds or seconds
         if timestamp > 1e12:
             timestamp = timestamp / 1e9
-        delta = datetime.fromtimestamp(0) - APPLE_EPOCH
-        return datetime.fromtimestamp(timestamp) - delta
-    except (ValueError, OSError):
+        return APPLE_EPOCH + timedelta(seconds=timestamp)
+    except (ValueError, OverflowError):
         return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
     """Represents an iMessage/SMS message."""
     
@@ -48,31 +96,79 @@ class Message:
     def date_formatted(self) -> str:
         """Get formatted date string."""
         if self.date:
-            return self.date.strftime("%Y-%m-%d %H:%M:%S")
+            return self.date.isoformat(" ", "seconds")
         return ""
 
 
-@dataclass 
+@dataclass(slots=True)
 class Chat:
-    """Represents a conversation/chat."""
+    """
+    Represents a conversation/chat.
+    
+    Messages are stored column-wise and only turned into Message objects
+    when indexed or iterated, so loading a large sms.db doesn't allocate
+    an object per message.
+    """
     
     chat_id: int
     display_name: str
     participants: List[str] = field(default_factory=list)
-    messages: List[Message] = field(default_factory=list)
     last_message_date: Optional[datetime] = None
+    _texts: List[str] = field(default_factory=list, init=False, repr=False)
+    _timestamps: array = field(default_factory=lambda: array("d"), init=False, repr=False)  # 0 if unset
+    _from_me: array = field(default_factory=lambda: array("B"), init=False, repr=False)
+    _handle_ids: array = field(default_factory=lambda: array("q"), init=False, repr=False)
+    _services: List[str] = field(default_factory=list, init=False, repr=False)
+    
+    def extend_messages(
+        self,
+        texts: Iterable[str],
+        timestamps: Iterable[float],
+        from_me: Iterable[int],
+        handle_ids: Iterable[int],
+        services: Iterable[str],
+    ):
+        """Append whole columns of messages at once (no None values)."""
+        self._texts.extend(texts)
+        self._timestamps.extend(timestamps)
+        self._from_me.extend(from_me)
+        self._handle_ids.extend(handle_ids)
+        self._services.extend(services)
+    
+    def __getitem__(self, index: int) -> Message:
+        return Message(
+            text=self._texts[index],
+            date=apple_timestamp_to_datetime(self._timestamps[index]),
+            is_from_me=bool(self._from_me[index]),
+            chat_id=self.chat_id,
+            handle_id=self._handle_ids[index],
+            service=self._services[index],
+        )
+    
+    def __iter__(self) -> Iterator[Message]:
+        for index in range(len(self._texts)):
+            yield self[index]
+    
+    @property
+    def messages(self) -> List[Message]:
+        """All messages as Message objects (materializes the whole chat)."""
+        return list(self)
     
     @property
     def message_count(self) -> int:
         """Get number of messages."""
-        return len(self.messages)
+        return len(self._texts)
     
     @property
     def preview(self) -> str:
         """Get preview of last message."""
-        if self.messages:
-            return self.messages[-1].text[:100]
+        if self._texts:
+            return self._texts[-1][:100]
         return ""
+    
+    def count_service(self, service: str) -> int:
+        """Count messages sent over the given service."""
+        return self._services.count(service)
 
 
 class MessagesExtractor:
@@ -131,81 +227,37 @@ class MessagesExtractor:
             return self._chats
         
         chats = {}
-        handles = {}
         
         try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            conn.row_factory = sqlite3.Row
-            
-            # Get handles (phone numbers/emails)
-            cursor = conn.execute("SELECT ROWID, id FROM handle")
-            for row in cursor:
-                handles[row["ROWID"]] = row["id"]
-            
-            # Get chats
-            cursor = conn.execute("""
-                SELECT ROWID, chat_identifier, display_name
-                FROM chat
-            """)
+            conn = self.parser.open_ro_db(db_path)
             
-            for row in cursor:
-                chat_id = row["ROWID"]
-                display_name = row["display_name"] or row["chat_identifier"] or "Unknown"
+            for chat_id, display_name, chat_identifier, participants in conn.execute(_SQL_CHATS):
                 chats[chat_id] = Chat(
                     chat_id=chat_id,
-                    display_name=display_name,
+                    display_name=display_name or chat_identifier or "Unknown",
+                    participants=participants.split(_LIST_SEPARATOR) if participants else [],
                 )
             
-            # Get messages with their chat associations
-            cursor = conn.execute("""
-                SELECT 
-                    m.ROWID,
-                    m.text,
-                    m.date,
-                    m.is_from_me,
-                    m.handle_id,
-                    m.service,
-                    cmj.chat_id
-                FROM message m
-                LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
-                ORDER BY m.date
-            """)
+            # Pull rows in large batches rather than one sqlite3_step per
+            # Python iteration
+            cursor = conn.execute(_SQL_MESSAGES)
+            cursor.arraysize = _FETCH_BATCH_SIZE
+            rows_iter = chain.from_iterable(iter(cursor.fetchmany, []))
             
-            for row in cursor:
-                chat_id = row["chat_id"]
-                if chat_id not in chats:
+            # Rows arrive grouped by chat, so each chat is looked up once
+            for chat_id, rows in groupby(rows_iter, key=itemgetter(0)):
+                chat = chats.get(chat_id)
+                if chat is None:
                     continue
                 
-                msg_date = apple_timestamp_to_datetime(row["date"])
-                
-                message = Message(
-                    text=row["text"] or "",
-                    date=msg_date,
-                    is_from_me=bool(row["is_from_me"]),
-                    chat_id=chat_id,
-                    handle_id=row["handle_id"] or 0,
-                    service=row["service"] or "",
+                # Transpose the group into columns and append them in bulk;
+                # service names are interned so each chat shares one string
+                _, texts, timestamps, from_me, handle_ids, services = zip(*rows)
+                chat.extend_messages(
+                    texts, timestamps, from_me, handle_ids, map(sys.intern, services)
                 )
                 
-                chats[chat_id].messages.append(message)
-                
-                if msg_date:
-                    if not chats[chat_id].last_message_date or msg_date > chats[chat_id].last_message_date:
-                        chats[chat_id].last_message_date = msg_date
-            
-            # Add participant handles to chats
-            cursor = conn.execute("""
-                SELECT chat_id, handle_id
-                FROM chat_handle_join
-            """)
-            
-            for row in cursor:
-                chat_id = row["chat_id"]
-                handle_id = row["handle_id"]
-                if chat_id in chats and handle_id in handles:
-                    chats[chat_id].participants.append(handles[handle_id])
-            
-            conn.close()
+                chat.last_message_date = apple_timestamp_to_datetime(max(timestamps))
             
         except sqlite3.Error as e:
             print(f"Error reading messages database: {e}")
@@ -220,19 +272,43 @@ class MessagesExtractor:
         self._chats = chat_list
         return self._chats
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get statistics about messages."""
+    def get_all_with_stats(self) -> Tuple[List[Chat], Dict[str, Any]]:
+        """
+        Get all chats together with their statistics.
+        
+        The stats are counted from the loaded chats instead of a second
+        query over every message.
+        
+        Returns:
+            (chats, stats dict)
+        """
         chats = self.get_all_chats()
+        return chats, self.get_stats()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about messages.
         
-        total_messages = sum(c.message_count for c in chats)
-        imessages = sum(
-            1 for c in chats 
-            for m in c.messages 
-            if m.service == "iMessage"
-        )
+        Counted by SQLite unless the chats are already loaded, so showing
+        stats doesn't require reading every message.
+        """
+        if self._chats is not None:
+            chats = self._chats
+            chat_count = len(chats)
+            total_messages = sum(c.message_count for c in chats)
+            imessages = sum(c.count_service("iMessage") for c in chats)
+        else:
+            chat_count = total_messages = imessages = 0
+            db_path = self._find_sms_db()
+            if db_path and db_path.exists():
+                try:
+                    conn = self.parser.open_ro_db(db_path)
+                    chat_count, total_messages, imessages = conn.execute(_SQL_STATS).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Error reading messages database: {e}")
         
         return {
-            "chat_count": len(chats),
+            "chat_count": chat_count,
             "message_count": total_messages,
             "imessage_count": imessages,
             "sms_count": total_messages - imessages,
@@ -252,7 +328,7 @@ class MessagesExtractor:
         try:
             lines = [f"Chat with: {chat.display_name}", "=" * 50, ""]
             
-            for msg in chat.messages:
+            for msg in chat:
                 sender = "Me" if msg.is_from_me else chat.display_name
                 date_str = msg.date_formatted
                 lines.append(f"[{date_str}] {sender}:")
@@ -284,18 +360,8 @@ class MessagesExtractor:
         
         destination.mkdir(parents=True, exist_ok=True)
         
-        successful = 0
-        for chat in chats:
-            if not chat.messages:
-                continue
-            
-            filename = f"{chat.display_name}.txt"
-            # Sanitize filename
-            filename = sanitize_filename(filename)
-            
-            filepath = destination / filename
-            
-            if self.export_chat_txt(chat, filepath):
-                successful += 1
-        
-        return successful
+        return export_unique_files(
+            (chat for chat in chats if chat.message_count),
+            lambda chat: sanitize_filename(f"{chat.display_name}.txt"),
+            lambda chat, filename: self.export_chat_txt(chat, destination / filename),
+        )
@@ -5,48 +5,247 @@ This module handles extracting notes from the NoteStore.sqlite
 database in iOS backups.
 """
 
+import os
 import sqlite3
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-import html
-import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from itertools import repeat
 
+from ._entities import unescape_entities
 from ..backup_parser import BackupParser, BackupFile
-from ...utils.helpers import sanitize_filename
+from ...utils.helpers import sanitize_filename, export_unique_files
+
+# python-isal inflates the same raw deflate streams several times faster
+# than zlib; use it when installed
+try:
+    from isal import isal_zlib as _deflate
+except ImportError:
+    _deflate = zlib
+
+_INFLATE_ERRORS = (zlib.error, _deflate.error)
 
 
 # iOS uses a different epoch (2001-01-01) for dates
 APPLE_EPOCH = datetime(2001, 1, 1)
 
+GZIP_MAGIC = b"\x1f\x8b"
+
+# iOS 9+ NoteStore.sqlite. Both queries return notes newest first; SQLite
+# sorts NULL dates last in descending order.
+_SQL_MODERN_NOTES = """
+    SELECT 
+        n.Z_PK,
+        n.ZTITLE1,
+        nd.ZDATA,
+        n.ZCREATIONDATE1,
+        n.ZMODIFICATIONDATE1
+    FROM ZICCLOUDSYNCINGOBJECT n
+    LEFT JOIN ZICNOTEDATA nd ON n.ZNOTEDATA = nd.Z_PK
+    WHERE n.ZTITLE1 IS NOT NULL
+    ORDER BY n.ZMODIFICATIONDATE1 DESC, n.Z_PK
+"""
+
+# Older notes.sqlite
+_SQL_LEGACY_NOTES = """
+    SELECT 
+        ROWID,
+        title,
+        body,
+        creation_date,
+        modification_date
+    FROM note
+    ORDER BY modification_date DESC, ROWID
+"""
+
+# Export files can be opened relative to a directory fd (POSIX only)
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+# Below this many notes, inflating on a thread pool costs more than it saves
+PARALLEL_DECODE_MIN_NOTES = 64
+
+# NoteStoreProto field numbers leading to the note text:
+# NoteStoreProto.document (2) -> Document.note (3) -> Note.note_text (2)
+NOTE_TEXT_FIELD_PATH = (2, 3, 2)
+
 
 def apple_timestamp_to_datetime(timestamp: float) -> Optional[datetime]:
     """Convert Apple timestamp to datetime."""
     if not timestamp:
         return None
     try:
-        # Core Data timestamps are seconds since 2001-01-01
-        delta = datetime.fromtimestamp(0) - APPLE_EPOCH
-        return datetime.fromtimestamp(timestamp) - delta
-    except (ValueError, OSError):
+        # Core Data timestamps are seconds since 2001-01-01; plain
+        # arithmetic avoids two fromtimestamp() calls per note
+        return APPLE_EPOCH + timedelta(seconds=timestamp)
+    except (ValueError, OverflowError):
         return None
 
 
+def apple_timestamps_to_datetimes(timestamps: Sequence[Optional[float]]) -> List[Optional[datetime]]:
+    """
+    Convert a whole column of Apple timestamps to datetimes.
+    
+    When every value is set, the conversion runs as chained map() calls
+    on C builtins with no Python-level call per value. Columns containing
+    missing or out-of-range values fall back to the scalar function.
+    
+    Args:
+        timestamps: Seconds since 2001-01-01 (None or 0 if unset)
+        
+    Returns:
+        List of datetimes (None where unset)
+    """
+    if all(timestamps):
+        try:
+            return list(map(APPLE_EPOCH.__add__, map(timedelta, repeat(0), timestamps)))
+        except (ValueError, OverflowError):
+            pass
+    return list(map(apple_timestamp_to_datetime, timestamps))
+
+
 def strip_html(text: str) -> str:
     """Strip HTML tags from text."""
     if not text:
         return ""
-    # Decode HTML entities
-    text = html.unescape(text)
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    return text.strip()
+    # Remove HTML tags in one pass, keeping the text between them
+    parts = []
+    pos = 0
+    while (start := text.find("<", pos)) >= 0:
+        end = text.find(">", start + 1)
+        if end < 0:
+            break
+        parts.append(text[pos:start])
+        pos = end + 1
+    parts.append(text[pos:])
+    # Decode HTML entities (after stripping, so "&lt;" stays literal text)
+    return unescape_entities("".join(parts)).strip()
 
 
-@dataclass
+# Use the compiled version when it has been built (see _notes_fast.pyx)
+try:
+    from ._notes_fast import strip_html
+except ImportError:
+    pass
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read a protobuf varint, returning (value, position after it)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _proto_field(data: bytes, number: int) -> Optional[bytes]:
+    """
+    Find the first length-delimited field with the given number.
+    
+    Args:
+        data: Serialized protobuf message
+        number: Field number to look for
+        
+    Returns:
+        The field's bytes, or None if absent or data isn't valid protobuf
+    """
+    pos = 0
+    end = len(data)
+    try:
+        while pos < end:
+            key, pos = _read_varint(data, pos)
+            wire_type = key & 0x7
+            if wire_type == 0:
+                _, pos = _read_varint(data, pos)
+            elif wire_type == 1:
+                pos += 8
+            elif wire_type == 2:
+                length, pos = _read_varint(data, pos)
+                if key >> 3 == number:
+                    return data[pos:pos + length] if pos + length <= end else None
+                pos += length
+            elif wire_type == 5:
+                pos += 4
+            else:
+                return None
+    except IndexError:
+        pass
+    return None
+
+
+def _proto_note_text(data: bytes) -> Optional[str]:
+    """Get the plain text out of a NoteStoreProto (document.note.note_text)."""
+    for number in NOTE_TEXT_FIELD_PATH:
+        data = _proto_field(data, number)
+        if data is None:
+            return None
+    return data.decode("utf-8", errors="ignore")
+
+
+def _note_content(blob: bytes) -> str:
+    """
+    Extract plain text from a ZICNOTEDATA.ZDATA blob.
+    
+    Modern notes are a gzipped protobuf holding the text directly; older
+    ones are raw deflate streams of HTML.
+    
+    Args:
+        blob: Raw note data
+        
+    Returns:
+        Note text, or "" if the blob can't be decoded
+    """
+    if not blob:
+        return ""
+    
+    try:
+        if blob[:2] == GZIP_MAGIC:
+            data = _deflate.decompress(blob, 31)
+        else:
+            data = _deflate.decompress(blob, -15)
+    except _INFLATE_ERRORS:
+        return _proto_note_text(blob) or ""
+    
+    text = _proto_note_text(data)
+    if text is not None:
+        return text.strip()
+    return strip_html(data.decode("utf-8", errors="ignore"))
+
+
+def _decode_note_blobs(blobs: Sequence[Optional[bytes]]) -> List[str]:
+    """
+    Extract the text of many note blobs, in parallel for large note stores.
+    
+    zlib releases the GIL while inflating, so decompression of separate
+    blobs overlaps across threads.
+    
+    Args:
+        blobs: ZICNOTEDATA.ZDATA values
+        
+    Returns:
+        Note text for each blob, in order
+    """
+    if len(blobs) < PARALLEL_DECODE_MIN_NOTES:
+        return list(map(_note_content, blobs))
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_note_content, blobs))
+
+
+@dataclass(slots=True)
 class Note:
-    """Represents a note from the Notes app."""
+    """
+    Represents a note from the Notes app.
+    
+    preview and word_count are computed from content on first access and
+    then cached, since the table reads them on every repaint.
+    """
     
     id: int
     title: str
@@ -55,32 +254,38 @@ class Note:
     created_date: Optional[datetime] = None
     modified_date: Optional[datetime] = None
     folder: str = "Notes"
+    _preview: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _word_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def preview(self) -> str:
         """Get preview of note content."""
-        text = self.content[:200]
-        if len(self.content) > 200:
-            text += "..."
-        return text
+        if self._preview is None:
+            text = self.content[:200]
+            if len(self.content) > 200:
+                text += "..."
+            self._preview = text
+        return self._preview
     
     @property
     def word_count(self) -> int:
         """Get approximate word count."""
-        return len(self.content.split())
+        if self._word_count is None:
+            self._word_count = len(self.content.split())
+        return self._word_count
     
     @property
     def created_formatted(self) -> str:
         """Get formatted creation date."""
         if self.created_date:
-            return self.created_date.strftime("%Y-%m-%d %H:%M")
+            return self.created_date.isoformat(" ", "minutes")
         return ""
     
     @property
     def modified_formatted(self) -> str:
         """Get formatted modification date."""
         if self.modified_date:
-            return self.modified_date.strftime("%Y-%m-%d %H:%M")
+            return self.modified_date.isoformat(" ", "minutes")
         return ""
 
 
@@ -101,6 +306,7 @@ class NotesExtractor:
         self.parser = parser
         self._notes: Optional[List[Note]] = None
         self._db_path: Optional[Path] = None
+        self._searched = False  # Set once the Manifest lookup has run, hit or miss
     
     @property
     def backup_path(self) -> Path:
@@ -109,10 +315,11 @@ class NotesExtractor:
     
     def _find_notes_db(self) -> Optional[Path]:
         """Find the Notes database in the backup."""
-        if self._db_path:
+        if self._searched:
             return self._db_path
+        self._searched = True
         
-        # Search for NoteStore.sqlite - try different locations
+        # Search for NoteStore.sqlite - modern location first, it nearly always hits
         search_patterns = [
             ("AppDomainGroup-group.com.apple.notes", "NoteStore.sqlite"),
             ("HomeDomain", "Library/Notes/notes.sqlite"),
@@ -121,8 +328,9 @@ class NotesExtractor:
         for domain, path in search_patterns:
             files = self.parser.get_files_by_path_pattern(domain, f"%{path}")
             if files:
-                self._db_path = files[0].get_backup_file_path(self.backup_path)
-                if self._db_path.exists():
+                db_path = files[0].get_backup_file_path(self.backup_path)
+                if db_path.exists():
+                    self._db_path = db_path
                     return self._db_path
         
         return None
@@ -138,80 +346,63 @@ class NotesExtractor:
             return self._notes
         
         db_path = self._find_notes_db()
-        if not db_path or not db_path.exists():
+        if not db_path:
             self._notes = []
             return self._notes
         
         notes = []
         
         try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-            conn.row_factory = sqlite3.Row
+            conn = self.parser.open_ro_db(db_path)
             
-            # Try modern Notes schema first
+            # Rows are split into columns and each column converted in one
+            # map() call, rather than building a Note field by field per row
             try:
-                cursor = conn.execute("""
-                    SELECT 
-                        n.Z_PK as id,
-                        n.ZTITLE1 as title,
-                        nd.ZDATA as data,
-                        n.ZCREATIONDATE1 as created,
-                        n.ZMODIFICATIONDATE1 as modified
-                    FROM ZICCLOUDSYNCINGOBJECT n
-                    LEFT JOIN ZICNOTEDATA nd ON n.ZNOTEDATA = nd.Z_PK
-                    WHERE n.ZTITLE1 IS NOT NULL
-                """)
-                
-                for row in cursor:
-                    content = ""
-                    if row["data"]:
-                        try:
-                            # Try to decode as zlib compressed
-                            import zlib
-                            data = zlib.decompress(row["data"], -15)
-                            content = strip_html(data.decode("utf-8", errors="ignore"))
-                        except:
-                            content = strip_html(str(row["data"]))
-                    
-                    note = Note(
-                        id=row["id"],
-                        title=row["title"] or "Untitled",
-                        content=content,
-                        created_date=apple_timestamp_to_datetime(row["created"]),
-                        modified_date=apple_timestamp_to_datetime(row["modified"]),
-                    )
-                    notes.append(note)
+                # Try modern Notes schema first
+                rows = conn.execute(_SQL_MODERN_NOTES).fetchall()
+                if rows:
+                    ids, titles, datas, created, modified = zip(*rows)
+                    contents = _decode_note_blobs(datas)
+                    notes = [
+                        Note(
+                            id=note_id,
+                            title=title or "Untitled",
+                            content=content,
+                            created_date=created_date,
+                            modified_date=modified_date,
+                        )
+                        for note_id, title, content, created_date, modified_date in zip(
+                            ids,
+                            titles,
+                            contents,
+                            apple_timestamps_to_datetimes(created),
+                            apple_timestamps_to_datetimes(modified),
+                        )
+                    ]
                     
             except sqlite3.OperationalError:
                 # Fall back to legacy schema
-                cursor = conn.execute("""
-                    SELECT 
-                        ROWID as id,
-                        title,
-                        body,
-                        creation_date as created,
-                        modification_date as modified
-                    FROM note
-                """)
-                
-                for row in cursor:
-                    note = Note(
-                        id=row["id"],
-                        title=row["title"] or "Untitled",
-                        content=strip_html(row["body"] or ""),
-                        html_content=row["body"] or "",
-                        created_date=apple_timestamp_to_datetime(row["created"]),
-                        modified_date=apple_timestamp_to_datetime(row["modified"]),
-                    )
-                    notes.append(note)
-            
-            conn.close()
-            
-            # Sort by modification date (newest first)
-            notes.sort(
-                key=lambda n: n.modified_date or datetime.min,
-                reverse=True
-            )
+                rows = conn.execute(_SQL_LEGACY_NOTES).fetchall()
+                if rows:
+                    ids, titles, bodies, created, modified = zip(*rows)
+                    notes = [
+                        Note(
+                            id=note_id,
+                            title=title or "Untitled",
+                            content=content,
+                            html_content=body or "",
+                            created_date=created_date,
+                            modified_date=modified_date,
+                        )
+                        for note_id, title, body, content, created_date, modified_date in zip(
+                            ids,
+                            titles,
+                            bodies,
+                            map(strip_html, bodies),
+                            apple_timestamps_to_datetimes(created),
+                            apple_timestamps_to_datetimes(modified),
+                        )
+                    ]
             
         except sqlite3.Error as e:
             print(f"Error reading notes database: {e}")
@@ -219,6 +410,18 @@ class NotesExtractor:
         self._notes = notes
         return self._notes
     
+    def get_all_with_stats(self) -> Tuple[List[Note], Dict[str, Any]]:
+        """
+        Get all notes together with their statistics.
+        
+        The stats are counted from the loaded notes.
+        
+        Returns:
+            (notes, stats dict)
+        """
+        notes = self.get_all_notes()
+        return notes, self.get_stats()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about notes."""
         notes = self.get_all_notes()
@@ -230,13 +433,14 @@ class NotesExtractor:
             "total_words": total_words,
         }
     
-    def export_note_txt(self, note: Note, destination: Path) -> bool:
+    def export_note_txt(self, note: Note, destination: Path, dir_fd: Optional[int] = None) -> bool:
         """
         Export a note as a text file.
         
         Args:
             note: Note to export
             destination: Destination file path
+            dir_fd: Open directory that a relative destination is resolved against
             
         Returns:
             True if successful
@@ -254,7 +458,11 @@ class NotesExtractor:
                 note.content,
             ]
             
-            with open(destination, "w", encoding="utf-8") as f:
+            opener = None
+            if dir_fd is not None:
+                opener = lambda path, flags: os.open(path, flags, 0o666, dir_fd=dir_fd)
+            
+            with open(destination, "w", encoding="utf-8", opener=opener) as f:
                 f.write("\\n".join(lines))
             
             return True
@@ -279,16 +487,25 @@ class NotesExtractor:
         
         destination.mkdir(parents=True, exist_ok=True)
         
-        successful = 0
-        for note in notes:
-            filename = f"{note.title}.txt"
-            # Sanitize filename
-            filename = sanitize_filename(filename)
-            filename = filename[:100]  # Limit length
-            
-            filepath = destination / filename
-            
-            if self.export_note_txt(note, filepath):
-                successful += 1
+        # Create files relative to one open directory handle instead of
+        # resolving the full destination path for every note
+        dir_fd = None
+        if _DIR_FD_SUPPORTED:
+            dir_fd = os.open(destination, os.O_RDONLY | os.O_DIRECTORY)
+        
+        def write(note: Note, filename: str) -> bool:
+            if dir_fd is not None:
+                return self.export_note_txt(note, Path(filename), dir_fd)
+            return self.export_note_txt(note, destination / filename)
+        
+        try:
+            successful = export_unique_files(
+                notes,
+                lambda note: sanitize_filename(f"{note.title}.txt")[:100],  # Limit length
+                write,
+            )
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
         
         return successful
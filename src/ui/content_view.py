@@ -2,27 +2,35 @@
 Content View - Main content area displaying files and stats.
 """
 
+import time
+from contextlib import contextmanager
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Any, Optional, List, Callable, Dict, Iterator, Sequence, Set, Tuple
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget,
-    QTableWidgetItem, QPushButton, QHeaderView, QFrame,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
+    QAbstractItemView, QPushButton, QHeaderView, QFrame,
     QProgressBar, QFileDialog, QMessageBox, QGridLayout,
-    QStackedWidget, QScrollArea, QApplication
+    QStackedWidget, QScrollArea, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
-from PyQt6.QtGui import QFont, QPixmap, QImage
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QThread, pyqtSlot, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, QSize, QSignalBlocker, QTimer
+)
+from PyQt6.QtGui import QFont, QPixmap, QImage, QImageReader, QPixmapCache
 
 from ..core.backup_parser import BackupParser, Backup
 from ..core.data_extractors.camera_roll import CameraRollExtractor, MediaFile, ExportProgress
-from ..core.data_extractors.contacts import ContactsExtractor, Contact
-from ..core.data_extractors.messages import MessagesExtractor, Chat
-from ..core.data_extractors.notes import NotesExtractor, Note
-from ..core.data_extractors.call_history import CallHistoryExtractor, CallRecord
+from ..core.data_extractors.contacts import ContactsExtractor
+from ..core.data_extractors.messages import MessagesExtractor
+from ..core.data_extractors.notes import NotesExtractor
+from ..core.data_extractors.call_history import CallHistoryExtractor
 from ..utils.helpers import format_file_size
-from ..utils.constants import DATA_TYPES
+from ..utils.constants import (
+    DATA_TYPES, LOAD_BATCH_SIZE, PROGRESS_UPDATE_INTERVAL, STATS_UPDATE_INTERVAL, THUMBNAIL_SIZE
+)
 
 
 class StatCard(QFrame):
@@ -88,31 +96,281 @@ class EmptyState(QWidget):
         layout.addWidget(message_label)
 
 
+def _format_date(date: Optional[datetime]) -> str:
+    """
+    Format a date for the table as "YYYY-MM-DD HH:MM".
+    
+    isoformat() gives the same text as strftime for the naive datetimes
+    the extractors produce, without going through libc.
+    """
+    return date.isoformat(" ", "minutes") if date else ""
+
+
+def _truncate_preview(text: str) -> str:
+    """Shorten a preview string to 50 characters for the table."""
+    return text[:50] + "..." if len(text) > 50 else text
+
+
+# Table columns for each category: (header, cell formatter taking a record)
+CATEGORY_COLUMNS = {
+    "camera_roll": (
+        ("Filename", attrgetter("filename")),
+        ("Type", lambda media: "📷 Photo" if media.is_image else "🎬 Video"),
+        ("Size", attrgetter("size_formatted")),
+        ("Date", lambda media: _format_date(media.modified_date)),
+    ),
+    "contacts": (
+        ("Name", attrgetter("display_name")),
+        ("Phone", attrgetter("primary_phone")),
+        ("Email", attrgetter("primary_email")),
+        ("Organization", attrgetter("organization")),
+    ),
+    "messages": (
+        ("Contact", attrgetter("display_name")),
+        ("Messages", lambda chat: str(chat.message_count)),
+        ("Last Message", lambda chat: _format_date(chat.last_message_date)),
+        ("Preview", lambda chat: _truncate_preview(chat.preview)),
+    ),
+    "notes": (
+        ("Title", attrgetter("title")),
+        ("Words", lambda note: str(note.word_count)),
+        ("Modified", attrgetter("modified_formatted")),
+        ("Preview", lambda note: _truncate_preview(note.preview)),
+    ),
+    "call_history": (
+        ("Phone Number", attrgetter("phone_number")),
+        ("Type", lambda call: f"{call.call_type_icon} {call.call_type_name}"),
+        ("Duration", attrgetter("duration_formatted")),
+        ("Date", attrgetter("date_formatted")),
+    ),
+}
+
+# Extractor class for each category, created on first use
+CATEGORY_EXTRACTORS = {
+    "camera_roll": CameraRollExtractor,
+    "contacts": ContactsExtractor,
+    "messages": MessagesExtractor,
+    "notes": NotesExtractor,
+    "call_history": CallHistoryExtractor,
+}
+
+
+def format_rows(
+    columns: Sequence[Tuple[str, Callable[[Any], str]]],
+    records: Sequence[Any]
+) -> List[Tuple[str, ...]]:
+    """
+    Format every cell of a table up front.
+    
+    Works column by column so each formatter runs in a single map() pass.
+    
+    Args:
+        columns: (header, cell formatter) for each column
+        records: Records to format
+        
+    Returns:
+        One tuple of cell strings per record
+    """
+    return list(zip(*(map(cell, records) for _, cell in columns)))
+
+
+class _ThumbnailSignals(QObject):
+    """Carries decoded thumbnails from the thread pool to the GUI thread."""
+    
+    ready = pyqtSignal(str, QImage)  # cache key, thumbnail
+
+
+class _ThumbnailTask(QRunnable):
+    """Decode one image straight to thumbnail size on a pool thread."""
+    
+    def __init__(self, key: str, path: Path, signals: _ThumbnailSignals):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.signals = signals
+    
+    def run(self):
+        # Decoding at the target size lets JPEG/HEIF skip most of the work
+        reader = QImageReader(str(self.path))
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(
+                size.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+        self.signals.ready.emit(self.key, reader.read())
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of records.
+    
+    Cells come from rows pre-formatted off the GUI thread when given
+    (see format_rows), and are otherwise formatted on demand in data().
+    The record itself is returned for Qt.ItemDataRole.UserRole.
+    
+    Camera Roll photos get a thumbnail in the first column. Thumbnails
+    are decoded on the global thread pool the first time their row is
+    painted and kept in QPixmapCache, keyed by the backup file ID.
+    """
+    
+    def __init__(
+        self,
+        columns: Sequence[Tuple[str, Callable[[Any], str]]],
+        records: Sequence[Any] = (),
+        rows: Optional[Sequence[Tuple[str, ...]]] = None,
+        parent=None
+    ):
+        """
+        Args:
+            columns: (header, cell formatter) for each column
+            records: Records backing the rows
+            rows: Formatted cell strings for each record, if already built
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._columns = columns
+        self._headers = [header for header, _ in columns]
+        self._cells = [cell for _, cell in columns]
+        self._records = list(records)
+        self._rows = list(rows) if rows is not None else None
+        
+        # Thumbnail key -> row waiting for it, and keys that can't be decoded
+        self._pending_thumbnails: Dict[str, int] = {}
+        self._failed_thumbnails: Set[str] = set()
+        self._thumbnail_signals = _ThumbnailSignals()
+        self._thumbnail_signals.ready.connect(self._on_thumbnail_ready)
+    
+    @property
+    def columns(self) -> Sequence[Tuple[str, Callable[[Any], str]]]:
+        """(header, cell formatter) for each column."""
+        return self._columns
+    
+    @property
+    def rows(self) -> Optional[List[Tuple[str, ...]]]:
+        """Formatted cells for each record, if the model keeps them."""
+        return self._rows
+    
+    def append_rows(self, records: Sequence[Any], rows: Optional[Sequence[Tuple[str, ...]]] = None):
+        """
+        Append records to the end of the table.
+        
+        Args:
+            records: Records to append
+            rows: Their formatted cells (formatted here if the model keeps
+                rows and none are given)
+        """
+        if not records:
+            return
+        
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._records.extend(records)
+        if self._rows is not None:
+            self._rows.extend(rows if rows is not None else format_rows(self._columns, records))
+        self.endInsertRows()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self._rows is not None:
+                return self._rows[index.row()][index.column()]
+            return self._cells[index.column()](self._records[index.row()])
+        if role == Qt.ItemDataRole.UserRole:
+            return self._records[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole and index.column() == 0:
+            record = self._records[index.row()]
+            if isinstance(record, MediaFile) and record.is_image:
+                return self._thumbnail(index.row(), record)
+        return None
+    
+    def _thumbnail(self, row: int, media: MediaFile) -> Optional[QPixmap]:
+        """Get a photo's cached thumbnail, starting its decode on a miss."""
+        key = media.backup_file.file_id
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        
+        if key not in self._pending_thumbnails and key not in self._failed_thumbnails:
+            self._pending_thumbnails[key] = row
+            QThreadPool.globalInstance().start(
+                _ThumbnailTask(key, media.source_path, self._thumbnail_signals)
+            )
+        return None
+    
+    @pyqtSlot(str, QImage)
+    def _on_thumbnail_ready(self, key: str, image: QImage):
+        """Cache a decoded thumbnail and repaint its row."""
+        row = self._pending_thumbnails.pop(key, None)
+        if row is None:
+            return
+        if image.isNull():
+            self._failed_thumbnails.add(key)
+            return
+        
+        # QPixmap has to be created on the GUI thread
+        QPixmapCache.insert(key, QPixmap.fromImage(image))
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
 class LoadWorker(QThread):
     """Worker thread for loading data."""
     
     finished = pyqtSignal(object)  # data (list of items)
+    batch_ready = pyqtSignal(list, object)  # items, their formatted rows
     stats_ready = pyqtSignal(dict)  # stats dict
     error = pyqtSignal(str)
     
-    def __init__(self, fetch_func: Callable, stats_func: Callable = None):
+    def __init__(
+        self,
+        fetch_func: Callable[[], Tuple[list, Optional[dict]]],
+        columns: Optional[Sequence[Tuple[str, Callable[[Any], str]]]] = None
+    ):
         super().__init__()
         self.fetch_func = fetch_func
-        self.stats_func = stats_func
+        self.columns = columns
+        self._cancelled = False
     
     def run(self):
         """Run the load operation."""
         try:
-            # Fetch stats first if available
-            if self.stats_func:
-                stats = self.stats_func()
+            # Data and stats come from one pass over the database
+            data, stats = self.fetch_func()
+            if self._cancelled:
+                return
+            if stats is not None:
                 self.stats_ready.emit(stats)
             
-            # Fetch data
-            data = self.fetch_func()
+            # Hand the data to the view in batches so the first rows show
+            # while the rest are still being formatted. Cells are formatted
+            # here rather than on the GUI thread.
+            for start in range(0, len(data), LOAD_BATCH_SIZE):
+                if self._cancelled:
+                    return
+                batch = data[start:start + LOAD_BATCH_SIZE]
+                rows = format_rows(self.columns, batch) if self.columns else None
+                self.batch_ready.emit(batch, rows)
             self.finished.emit(data)
         except Exception as e:
             self.error.emit(str(e))
+    
+    def cancel(self):
+        """Cancel the load; it stops at the next batch boundary."""
+        self._cancelled = True
 
 
 class ExportWorker(QThread):
@@ -132,43 +390,91 @@ class ExportWorker(QThread):
     
     def run(self):
         """Run the export operation."""
-        import time
         try:
             successful = 0
-            start_time = time.time()
+            start_time = time.monotonic()
+            last_emit = last_stats = float("-inf")
             
-            for p in self.extractor.export_all(
-                self.destination,
-                filter_type=self.filter_type
-            ):
+            for p in self._export():
                 if self._cancelled:
                     break
                 
-                # Calculate stats
-                elapsed = time.time() - start_time
-                rate = p.current / elapsed if elapsed > 0 else 0
-                remaining_items = p.total - p.current
-                eta_seconds = remaining_items / rate if rate > 0 else 0
+                successful = p.successful
+                
+                # Each emit wakes the GUI thread, so send at most one update
+                # per interval (and always the last one)
+                now = time.monotonic()
+                if now - last_emit < PROGRESS_UPDATE_INTERVAL and p.current != p.total:
+                    continue
+                last_emit = now
                 
-                stats = {
-                    "rate": f"{rate:.1f} files/s",
-                    "eta": f"{int(eta_seconds)}s",
-                    "elapsed": f"{int(elapsed)}s",
-                    "percentage": p.percentage
-                }
+                # Speed and ETA change slowly, so they're recalculated less
+                # often than the bar moves; an empty dict keeps the last ones
+                stats = {}
+                if now - last_stats >= STATS_UPDATE_INTERVAL or p.current == p.total:
+                    last_stats = now
+                    elapsed = now - start_time
+                    rate = p.current / elapsed if elapsed > 0 else 0
+                    remaining_items = p.total - p.current
+                    eta_seconds = remaining_items / rate if rate > 0 else 0
+                    
+                    stats = {
+                        "rate": f"{rate:.1f} files/s",
+                        "eta": f"{int(eta_seconds)}s",
+                        "elapsed": f"{int(elapsed)}s",
+                    }
                 
                 self.progress.emit(p.current, p.total, p.current_file, stats)
-                successful = p.current
             
             self.finished.emit(successful)
         except Exception as e:
             self.error.emit(str(e))
     
+    def _export(self) -> Iterator[ExportProgress]:
+        """Start the export and return its progress updates."""
+        return self.extractor.export_all(
+            self.destination,
+            filter_type=self.filter_type
+        )
+    
     def cancel(self):
         """Cancel the export operation."""
         self._cancelled = True
 
 
+class ExportFilesWorker(ExportWorker):
+    """Worker thread for exporting a chosen set of Camera Roll files."""
+    
+    def __init__(self, extractor: CameraRollExtractor, files: List[MediaFile], destination: Path):
+        super().__init__(extractor, destination)
+        self.files = files
+    
+    def _export(self) -> Iterator[ExportProgress]:
+        """Start the export and return its progress updates."""
+        return self.extractor.iter_export_files(self.files, self.destination)
+
+
+class SimpleExportWorker(QThread):
+    """Worker thread for exports that only report their result at the end."""
+    
+    finished = pyqtSignal(object)  # whatever the export function returned
+    error = pyqtSignal(str)
+    
+    def __init__(self, export_func: Callable[[], Any]):
+        super().__init__()
+        self.export_func = export_func
+    
+    def run(self):
+        """Run the export operation."""
+        try:
+            self.finished.emit(self.export_func())
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def cancel(self):
+        """These exports can't be interrupted; callers just wait for them."""
+
+
 class ContentView(QWidget):
     """
     Main content view displaying stats, file list, and export controls.
@@ -180,6 +486,7 @@ class ContentView(QWidget):
     
     export_started = pyqtSignal()
     export_finished = pyqtSignal(int)
+    selection_changed = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -188,16 +495,25 @@ class ContentView(QWidget):
         self._parser: Optional[BackupParser] = None
         self._backup: Optional[Backup] = None
         self._current_category: str = "camera_roll"
-        self._export_worker: Optional[ExportWorker] = None
+        self._export_worker: Optional[QThread] = None
+        self._export_stats: Dict[str, str] = {}
+        self._exporting: bool = False
         self._load_worker: Optional[LoadWorker] = None
+        self._loading_category: Optional[str] = None
+        # True while the current category is loading (Export All waits for it)
+        self._loading: bool = False
+        # Bumped whenever loading is cancelled, so deferred starts go stale
+        self._load_generation: int = 0
+        # Cancelled loads still running, by category (kept alive until done)
+        self._stale_workers: Dict[str, LoadWorker] = {}
         self._mode: str = "pro"
         
-        # Extractors for different data types
-        self._camera_extractor: Optional[CameraRollExtractor] = None
-        self._contacts_extractor: Optional[ContactsExtractor] = None
-        self._messages_extractor: Optional[MessagesExtractor] = None
-        self._notes_extractor: Optional[NotesExtractor] = None
-        self._calls_extractor: Optional[CallHistoryExtractor] = None
+        # Loaded categories: (backup path, category) -> (records, rows, stats)
+        self._category_cache: Dict[Tuple[Path, str], Tuple[list, Optional[list], Optional[dict]]] = {}
+        self._loaded_stats: Optional[dict] = None
+        
+        # Extractors for the open backup, by category
+        self._extractors: Dict[str, Any] = {}
         
         self._setup_ui()
     
@@ -301,23 +617,62 @@ class ContentView(QWidget):
     
     def _setup_table(self):
         """Set up the file table."""
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.table.setObjectName("fileTable")
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Filename", "Type", "Size", "Date"])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setAlternatingRowColors(True)
-        
-        # Column sizing
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.setIconSize(QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.table.verticalHeader().hide()
         
         self.content_layout.addWidget(self.table, 1)  # Stretch factor
     
+    @contextmanager
+    def _bulk_update(self):
+        """
+        Suspend table repaints and signals while it's changed in bulk.
+        
+        The selection model is blocked too, so inserting rows doesn't run
+        _on_selection_changed; callers refresh the selection state once
+        afterwards if it may have changed.
+        """
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(self.table)]
+        selection = self.table.selectionModel()
+        if selection is not None:
+            blockers.append(QSignalBlocker(selection))
+        try:
+            yield
+        finally:
+            for blocker in reversed(blockers):
+                blocker.unblock()
+            self.table.setUpdatesEnabled(True)
+            self.table.setSortingEnabled(sorting)
+    
+    def _set_model(self, model: RecordTableModel):
+        """Show a new model in the file table, replacing the previous one."""
+        old_model = self.table.model()
+        old_selection = self.table.selectionModel()
+        
+        # Swap the model and re-size columns in one repaint
+        with self._bulk_update():
+            self.table.setModel(model)
+            self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+            
+            # Column sizing (sections are rebuilt whenever the model changes)
+            header = self.table.horizontalHeader()
+            header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        
+        if old_model is not None:
+            old_model.deleteLater()
+        if old_selection is not None:
+            old_selection.deleteLater()
+        
+        self._on_selection_changed()
+    
     def _setup_export_controls(self):
         """Set up export controls."""
         export_container = QWidget()
@@ -338,11 +693,12 @@ class ContentView(QWidget):
         # Stats container
         stats_layout = QHBoxLayout()
         
+        # Sized by the row's spare width rather than its text, so long
+        # filenames can be elided to fit
         self.progress_label = QLabel("")
         self.progress_label.setStyleSheet("color: #333; font-weight: 500;")
-        stats_layout.addWidget(self.progress_label)
-        
-        stats_layout.addStretch()
+        self.progress_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        stats_layout.addWidget(self.progress_label, 1)
         
         self.stats_label = QLabel("")
         self.stats_label.setStyleSheet("color: #666; font-size: 11px;")
@@ -371,8 +727,8 @@ class ContentView(QWidget):
         
         self.content_layout.addWidget(export_container)
         
-        # Connect table selection
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        # Start with an empty Camera Roll table
+        self._set_model(RecordTableModel(CATEGORY_COLUMNS["camera_roll"], parent=self.table))
     
     def set_backup(self, backup_path: Path):
         """
@@ -381,9 +737,14 @@ class ContentView(QWidget):
         Args:
             backup_path: Path to the backup folder
         """
-        # Close existing parser
+        # Close existing parser, once no load or export is still reading from it
+        self._stop_export()
+        self._cancel_loading()
+        self._wait_for_loads()
         if self._parser:
             self._parser.close()
+        self._category_cache.clear()
+        self._extractors.clear()
         
         # Open new parser
         self._parser = BackupParser(backup_path)
@@ -397,13 +758,6 @@ class ContentView(QWidget):
         
         self._backup = self._parser.backup
         
-        # Initialize all extractors
-        self._camera_extractor = CameraRollExtractor(self._parser)
-        self._contacts_extractor = ContactsExtractor(self._parser)
-        self._messages_extractor = MessagesExtractor(self._parser)
-        self._notes_extractor = NotesExtractor(self._parser)
-        self._calls_extractor = CallHistoryExtractor(self._parser)
-        
         # Update header
         if self._backup:
             self.device_label.setText(
@@ -445,60 +799,113 @@ class ContentView(QWidget):
         self.header_title.setText(info.get("name", category))
         self.header_subtitle.setText(info.get("description", ""))
         
-        # Stop previous load if running
-        if self._load_worker and self._load_worker.isRunning():
-            self._load_worker.wait()
+        # Cancel the previous load rather than blocking on it; anything it
+        # still emits is ignored
+        self._cancel_loading()
         
-        self.stack.setCurrentWidget(self.loading_state)
-        # Process events to show loading state immediately
-        QApplication.processEvents()
+        # An extractor can't be loaded from two threads at once, so an
+        # earlier load of this same category is allowed to finish first
+        stale = self._stale_workers.pop(category, None)
+        if stale is not None:
+            stale.wait()
         
-        fetch_func = None
-        stats_func = None
-        columns = []
+        # Categories already loaded for this backup are shown from the cache
+        cached = None
+        if self._backup:
+            cached = self._category_cache.get((self._backup.path, category))
+        if cached is not None:
+            records, rows, stats = cached
+            if stats:
+                self._show_stats(stats)
+            self._set_model(RecordTableModel(CATEGORY_COLUMNS[category], records, rows, self.table))
+            self.stack.setCurrentWidget(self.content_widget)
+            return
         
-        if category == "camera_roll" and self._camera_extractor:
-            fetch_func = self._camera_extractor.get_all_media
-            stats_func = self._camera_extractor.get_stats
-            columns = ["Filename", "Type", "Size", "Date"]
-            
-        elif category == "contacts" and self._contacts_extractor:
-            fetch_func = self._contacts_extractor.get_all_contacts
-            stats_func = self._contacts_extractor.get_stats
-            columns = ["Name", "Phone", "Email", "Organization"]
-            
-        elif category == "messages" and self._messages_extractor:
-            fetch_func = self._messages_extractor.get_all_chats
-            stats_func = self._messages_extractor.get_stats
-            columns = ["Contact", "Messages", "Last Message", "Preview"]
-            
-        elif category == "notes" and self._notes_extractor:
-            fetch_func = self._notes_extractor.get_all_notes
-            stats_func = self._notes_extractor.get_stats
-            columns = ["Title", "Words", "Modified", "Preview"]
-            
-        elif category == "call_history" and self._calls_extractor:
-            fetch_func = self._calls_extractor.get_all_calls
-            stats_func = self._calls_extractor.get_stats
-            columns = ["Phone Number", "Type", "Duration", "Date"]
+        # Start the load on the next event loop pass, once the loading
+        # state has been painted
+        self._set_loading(True)
+        self.stack.setCurrentWidget(self.loading_state)
+        generation = self._load_generation
+        QTimer.singleShot(0, lambda: self._start_category_load(category, generation))
+    
+    def _start_category_load(self, category: str, generation: int):
+        """
+        Start loading a category scheduled by _load_category.
         
-        if fetch_func:
+        Args:
+            category: Category ID
+            generation: Value of _load_generation when it was scheduled;
+                the start is dropped if loading was cancelled since
+        """
+        if generation != self._load_generation:
+            return
+        
+        extractor = self._get_extractor(category)
+        if extractor:
+            columns = CATEGORY_COLUMNS[category]
             self._setup_table_columns(columns)
-            self._start_loading(fetch_func, stats_func)
+            self._start_loading(extractor.get_all_with_stats, columns)
         else:
+            self._set_loading(False)
             self._clear_table()
             self.stack.setCurrentWidget(self.content_widget)
 
-    def _setup_table_columns(self, labels: List[str]):
-        """Setup table columns."""
-        self.table.setColumnCount(len(labels))
-        self.table.setHorizontalHeaderLabels(labels)
-        self.table.setRowCount(0)
+    def _get_extractor(self, category: str) -> Optional[Any]:
+        """
+        Get the extractor for a category, creating it on first use.
+        
+        Args:
+            category: Category ID
+            
+        Returns:
+            The extractor, or None if no backup is open
+        """
+        if not self._parser or category not in CATEGORY_EXTRACTORS:
+            return None
+        extractor = self._extractors.get(category)
+        if extractor is None:
+            extractor = CATEGORY_EXTRACTORS[category](self._parser)
+            self._extractors[category] = extractor
+        return extractor
+    
+    def _setup_table_columns(self, columns: Sequence[Tuple[str, Callable[[Any], str]]]):
+        """Setup table columns, with an empty table for the load to fill."""
+        self._set_model(RecordTableModel(columns, rows=[], parent=self.table))
 
-    def _start_loading(self, fetch_func, stats_func):
+    def _cancel_loading(self):
+        """Cancel the running load and let it wind down in the background."""
+        self._load_generation += 1
+        self._set_loading(False)
+        if self._load_worker and self._load_worker.isRunning():
+            self._load_worker.cancel()
+            self._stale_workers[self._loading_category] = self._load_worker
+        self._load_worker = None
+        
+        # Drop references to cancelled loads that have since finished
+        self._stale_workers = {
+            category: worker
+            for category, worker in self._stale_workers.items()
+            if worker.isRunning()
+        }
+    
+    def _wait_for_loads(self):
+        """Block until every cancelled load has finished."""
+        for worker in self._stale_workers.values():
+            worker.wait()
+        self._stale_workers.clear()
+    
+    def _set_loading(self, loading: bool):
+        """Mark whether the current category is loading; Export All waits for it."""
+        self._loading = loading
+        self._update_export_all_btn()
+    
+    def _start_loading(self, fetch_func, columns=None):
         """Start the background load worker."""
-        self._load_worker = LoadWorker(fetch_func, stats_func)
+        self._loaded_stats = None
+        self._loading_category = self._current_category
+        self._load_worker = LoadWorker(fetch_func, columns)
         self._load_worker.stats_ready.connect(self._on_stats_ready)
+        self._load_worker.batch_ready.connect(self._on_batch_ready)
         self._load_worker.finished.connect(self._on_load_finished)
         self._load_worker.error.connect(self._on_load_error)
         self._load_worker.start()
@@ -506,6 +913,14 @@ class ContentView(QWidget):
     @pyqtSlot(dict)
     def _on_stats_ready(self, stats: dict):
         """Handle stats update."""
+        if self.sender() is not self._load_worker:
+            return
+        
+        self._loaded_stats = stats
+        self._show_stats(stats)
+    
+    def _show_stats(self, stats: dict):
+        """Show a category's stats in the stat cards."""
         category = self._current_category
         
         if category == "camera_roll":
@@ -538,143 +953,99 @@ class ContentView(QWidget):
             self.stat_videos.update_value(f"📤 {stats['outgoing']}")
             self.stat_size.update_value(f"📵 {stats['missed']}")
 
+    @pyqtSlot(list, object)
+    def _on_batch_ready(self, records: list, rows: object):
+        """Append a batch of loaded (and already formatted) rows to the table."""
+        # A batch still queued from a previous category's load is dropped
+        if self.sender() is not self._load_worker:
+            return
+        
+        self.stack.setCurrentWidget(self.content_widget)
+        with self._bulk_update():
+            self.table.model().append_rows(records, rows)
+    
     @pyqtSlot(object)
     def _on_load_finished(self, data: object):
         """Handle load completion."""
+        if self.sender() is not self._load_worker:
+            return
+        
+        # Rows have already arrived through batch_ready
+        self._set_loading(False)
         self.stack.setCurrentWidget(self.content_widget)
         
-        category = self._current_category
-        if category == "camera_roll":
-            self._populate_camera_roll(data)
-        elif category == "contacts":
-            self._populate_contacts(data)
-        elif category == "messages":
-            self._populate_messages(data)
-        elif category == "notes":
-            self._populate_notes(data)
-        elif category == "call_history":
-            self._populate_call_history(data)
+        if self._backup:
+            self._category_cache[(self._backup.path, self._current_category)] = (
+                data, self.table.model().rows, self._loaded_stats
+            )
     
     @pyqtSlot(str)
     def _on_load_error(self, error: str):
         """Handle load error."""
+        if self.sender() is not self._load_worker:
+            return
+        
+        self._set_loading(False)
         self.stack.setCurrentWidget(self.content_widget)
         # Maybe show error in empty state instead?
         QMessageBox.warning(self, "Load Error", f"Failed to load data: {error}")
     
     def _clear_table(self):
         """Clear the table and reset stats."""
-        self.table.setRowCount(0)
+        self._set_model(RecordTableModel(self.table.model().columns, parent=self.table))
         self.stat_total.update_value("0")
         self.stat_photos.update_value("-")
         self.stat_videos.update_value("-")
         self.stat_size.update_value("-")
     
-    def _populate_camera_roll(self, files: List[MediaFile]):
-        """Populate table with Camera Roll data."""
-        self.table.setRowCount(len(files))
-        
-        for row, media in enumerate(files):
-            self.table.setItem(row, 0, QTableWidgetItem(media.filename))
-            type_str = "📷 Photo" if media.is_image else "🎬 Video"
-            self.table.setItem(row, 1, QTableWidgetItem(type_str))
-            self.table.setItem(row, 2, QTableWidgetItem(media.size_formatted))
-            date_str = media.modified_date.strftime("%Y-%m-%d %H:%M") if media.modified_date else ""
-            self.table.setItem(row, 3, QTableWidgetItem(date_str))
-            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, media)
-    
-    def _populate_contacts(self, contacts: List[Contact]):
-        """Populate table with Contacts data."""
-        self.table.setRowCount(len(contacts))
-        
-        for row, contact in enumerate(contacts):
-            self.table.setItem(row, 0, QTableWidgetItem(contact.display_name))
-            self.table.setItem(row, 1, QTableWidgetItem(contact.primary_phone))
-            self.table.setItem(row, 2, QTableWidgetItem(contact.primary_email))
-            self.table.setItem(row, 3, QTableWidgetItem(contact.organization))
-            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, contact)
-    
-    def _populate_messages(self, chats: List[Chat]):
-        """Populate table with Messages data."""
-        self.table.setRowCount(len(chats))
-        
-        for row, chat in enumerate(chats):
-            self.table.setItem(row, 0, QTableWidgetItem(chat.display_name))
-            self.table.setItem(row, 1, QTableWidgetItem(str(chat.message_count)))
-            date_str = chat.last_message_date.strftime("%Y-%m-%d %H:%M") if chat.last_message_date else ""
-            self.table.setItem(row, 2, QTableWidgetItem(date_str))
-            self.table.setItem(row, 3, QTableWidgetItem(chat.preview[:50] + "..." if len(chat.preview) > 50 else chat.preview))
-            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, chat)
-    
-    def _populate_notes(self, notes: List[Note]):
-        """Populate table with Notes data."""
-        self.table.setRowCount(len(notes))
-        
-        for row, note in enumerate(notes):
-            self.table.setItem(row, 0, QTableWidgetItem(note.title))
-            self.table.setItem(row, 1, QTableWidgetItem(str(note.word_count)))
-            self.table.setItem(row, 2, QTableWidgetItem(note.modified_formatted))
-            preview = note.preview[:50] + "..." if len(note.preview) > 50 else note.preview
-            self.table.setItem(row, 3, QTableWidgetItem(preview))
-            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, note)
-    
-    def _populate_call_history(self, calls: List[CallRecord]):
-        """Populate table with Call History data."""
-        self.table.setRowCount(len(calls))
-        
-        for row, call in enumerate(calls):
-            self.table.setItem(row, 0, QTableWidgetItem(call.phone_number))
-            self.table.setItem(row, 1, QTableWidgetItem(f"{call.call_type_icon} {call.call_type_name}"))
-            self.table.setItem(row, 2, QTableWidgetItem(call.duration_formatted))
-            self.table.setItem(row, 3, QTableWidgetItem(call.date_formatted))
-            self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, call)
-    
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_):
         """Handle table selection changes."""
-        selected = self.table.selectedItems()
-        self.export_selected_btn.setEnabled(len(selected) > 0)
+        self.export_selected_btn.setEnabled(self.table.selectionModel().hasSelection())
+        self.selection_changed.emit()
     
     def _export_all(self):
         """Export all data based on current category."""
+        # The export reads the same extractor, which can't be loaded from
+        # two threads at once (Export Selected can still get here)
+        if self._loading:
+            return
+        
         destination = self._get_export_destination()
         if not destination:
             return
         
         category = self._current_category
+        if not self._get_extractor(category):
+            return
         
-        if category == "camera_roll" and self._camera_extractor:
+        if category == "camera_roll":
             self._start_camera_export(destination)
-        elif category == "contacts" and self._contacts_extractor:
+        elif category == "contacts":
             self._export_contacts(destination)
-        elif category == "messages" and self._messages_extractor:
+        elif category == "messages":
             self._export_messages(destination)
-        elif category == "notes" and self._notes_extractor:
+        elif category == "notes":
             self._export_notes(destination)
-        elif category == "call_history" and self._calls_extractor:
+        elif category == "call_history":
             self._export_calls(destination)
     
     def _export_selected(self):
         """Export selected items (Camera Roll only for now)."""
-        if self._current_category != "camera_roll" or not self._camera_extractor:
+        if self._current_category != "camera_roll" or not self._get_extractor("camera_roll"):
             # For non-camera categories, export all
             self._export_all()
             return
         
-        # Get selected files
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
-        
+        # Get selected files (one column-0 index per fully selected row)
+        selected_rows = self.table.selectionModel().selectedRows()
         if not selected_rows:
             return
         
         files = []
-        for row in selected_rows:
-            item = self.table.item(row, 0)
-            if item:
-                media = item.data(Qt.ItemDataRole.UserRole)
-                if media:
-                    files.append(media)
+        for index in selected_rows:
+            media = index.data(Qt.ItemDataRole.UserRole)
+            if media:
+                files.append(media)
         
         destination = self._get_export_destination()
         if not destination:
@@ -685,44 +1056,96 @@ class ContentView(QWidget):
     
     def _export_contacts(self, destination: Path):
         """Export contacts as vCards."""
-        count = self._contacts_extractor.export_all_vcards(destination)
-        QMessageBox.information(
-            self, "Export Complete",
-            f"Successfully exported {count} contacts as vCard files."
-        )
-        self.export_finished.emit(count)
+        extractor = self._get_extractor("contacts")
+        
+        def done(count: int):
+            QMessageBox.information(
+                self, "Export Complete",
+                f"Successfully exported {count} contacts as vCard files."
+            )
+            self.export_finished.emit(count)
+        
+        self._start_simple_export(lambda: extractor.export_all_vcards(destination), done)
     
     def _export_messages(self, destination: Path):
         """Export messages as text files."""
-        count = self._messages_extractor.export_all_chats(destination)
-        QMessageBox.information(
-            self, "Export Complete",
-            f"Successfully exported {count} conversations as text files."
-        )
-        self.export_finished.emit(count)
+        extractor = self._get_extractor("messages")
+        
+        def done(count: int):
+            QMessageBox.information(
+                self, "Export Complete",
+                f"Successfully exported {count} conversations as text files."
+            )
+            self.export_finished.emit(count)
+        
+        self._start_simple_export(lambda: extractor.export_all_chats(destination), done)
     
     def _export_notes(self, destination: Path):
         """Export notes as text files."""
-        count = self._notes_extractor.export_all_notes(destination)
-        QMessageBox.information(
-            self, "Export Complete",
-            f"Successfully exported {count} notes as text files."
-        )
-        self.export_finished.emit(count)
+        extractor = self._get_extractor("notes")
+        
+        def done(count: int):
+            QMessageBox.information(
+                self, "Export Complete",
+                f"Successfully exported {count} notes as text files."
+            )
+            self.export_finished.emit(count)
+        
+        self._start_simple_export(lambda: extractor.export_all_notes(destination), done)
     
     def _export_calls(self, destination: Path):
         """Export call history as CSV."""
         csv_path = destination / "call_history.csv"
-        success = self._calls_extractor.export_all_calls(csv_path)
-        if success:
-            stats = self._calls_extractor.get_stats()
+        extractor = self._get_extractor("call_history")
+        
+        def export() -> Optional[int]:
+            if not extractor.export_all_calls(csv_path):
+                return None
+            return extractor.get_stats()["total_calls"]
+        
+        def done(count: Optional[int]):
+            if count is None:
+                QMessageBox.warning(self, "Export Failed", "Failed to export call history.")
+                return
             QMessageBox.information(
                 self, "Export Complete",
-                f"Successfully exported {stats['total_calls']} call records to:\n{csv_path}"
+                f"Successfully exported {count} call records to:\n{csv_path}"
             )
-            self.export_finished.emit(stats['total_calls'])
-        else:
-            QMessageBox.warning(self, "Export Failed", "Failed to export call history.")
+            self.export_finished.emit(count)
+        
+        self._start_simple_export(export, done)
+    
+    def _start_simple_export(self, export_func: Callable[[], Any], on_done: Callable[[Any], None]):
+        """
+        Run a contacts/messages/notes/calls export in a background thread.
+        
+        Args:
+            export_func: Runs the export on the worker thread
+            on_done: Called on the GUI thread with export_func's result
+        """
+        self.export_started.emit()
+        
+        # These exports don't report progress, so show a busy bar
+        self.progress_container.show()
+        self.progress_bar.setRange(0, 0)
+        self.progress_label.setText("Exporting...")
+        self.stats_label.setText("")
+        self._exporting = True
+        self.export_all_btn.setEnabled(False)
+        self.export_selected_btn.setEnabled(False)
+        
+        worker = SimpleExportWorker(export_func)
+        
+        def finished(result: Any):
+            if worker is not self._export_worker:
+                return
+            self._end_export()
+            on_done(result)
+        
+        self._export_worker = worker
+        self._export_worker.finished.connect(finished)
+        self._export_worker.error.connect(self._on_export_error)
+        self._export_worker.start()
     
     def _start_camera_export(self, destination: Path):
         """Start Camera Roll export in background thread."""
@@ -730,10 +1153,12 @@ class ContentView(QWidget):
         
         self.progress_container.show()
         self.progress_bar.setValue(0)
+        self._export_stats = {}
+        self._exporting = True
         self.export_all_btn.setEnabled(False)
         self.export_selected_btn.setEnabled(False)
         
-        self._export_worker = ExportWorker(self._camera_extractor, destination)
+        self._export_worker = ExportWorker(self._get_extractor("camera_roll"), destination)
         self._export_worker.progress.connect(self._on_export_progress)
         self._export_worker.finished.connect(self._on_export_finished)
         self._export_worker.error.connect(self._on_export_error)
@@ -754,51 +1179,58 @@ class ContentView(QWidget):
     
     def _start_export_files(self, files: List[MediaFile], destination: Path):
         """Start exporting specific files."""
-        if not self._camera_extractor:
+        extractor = self._get_extractor("camera_roll")
+        if not extractor:
             return
         
         self.export_started.emit()
         
         self.progress_container.show()
         self.progress_bar.setValue(0)
+        self._export_stats = {}
+        self._exporting = True
         self.export_all_btn.setEnabled(False)
         self.export_selected_btn.setEnabled(False)
         
-        # Export directly (could be threaded for large selections)
         self.stats_label.setText("Exporting selected files...")
         
-        def progress_callback(p: ExportProgress):
-            self.progress_bar.setValue(int(p.percentage))
-            self.progress_label.setText(f"Exporting: {p.current_file}")
-            # Ensure UI updates during blocking operation
-            QApplication.processEvents()
-        
-        count = self._camera_extractor.export_files(files, destination, progress_callback)
-        self._on_export_finished(count)
+        self._export_worker = ExportFilesWorker(extractor, files, destination)
+        self._export_worker.progress.connect(self._on_export_progress)
+        self._export_worker.finished.connect(self._on_export_finished)
+        self._export_worker.error.connect(self._on_export_error)
+        self._export_worker.start()
     
     @pyqtSlot(int, int, str, dict)
     def _on_export_progress(self, current: int, total: int, filename: str, stats: dict):
         """Handle export progress update with detailed stats."""
-        # Update progress bar
-        self.progress_bar.setValue(int(stats.get("percentage", 0)))
-        
-        # Update filename label (truncate if too long)
-        display_name = filename
-        if len(display_name) > 40:
-            display_name = "..." + display_name[-37:]
-        self.progress_label.setText(f"Exporting: {display_name}")
+        if self.sender() is not self._export_worker:
+            return
         
-        # Update stats label
-        rate = stats.get("rate", "-")
-        eta = stats.get("eta", "-")
+        # Update progress bar
+        self.progress_bar.setValue(current * 100 // total if total else 0)
+        
+        # Update filename label, eliding the middle of long names to fit
+        prefix = "Exporting: "
+        metrics = self.progress_label.fontMetrics()
+        width = self.progress_label.width() - metrics.horizontalAdvance(prefix)
+        display_name = metrics.elidedText(filename, Qt.TextElideMode.ElideMiddle, width)
+        self.progress_label.setText(prefix + display_name)
+        
+        # Update stats label; an empty dict means speed/ETA are unchanged
+        if stats:
+            self._export_stats = stats
+        rate = self._export_stats.get("rate", "-")
+        eta = self._export_stats.get("eta", "-")
         self.stats_label.setText(f"Speed: {rate} • ETA: {eta} • {current}/{total}")
     
     @pyqtSlot(int)
     def _on_export_finished(self, count: int):
         """Handle export completion."""
-        self.progress_container.hide()
-        self.export_all_btn.setEnabled(True)
-        self._on_selection_changed()  # Re-enable selected button if applicable
+        # Signals queued before the worker was stopped are dropped
+        if self.sender() is not self._export_worker:
+            return
+        
+        self._end_export()
         
         QMessageBox.information(
             self,
@@ -811,9 +1243,10 @@ class ContentView(QWidget):
     @pyqtSlot(str)
     def _on_export_error(self, error: str):
         """Handle export error."""
-        self.progress_container.hide()
-        self.export_all_btn.setEnabled(True)
-        self._on_selection_changed()
+        if self.sender() is not self._export_worker:
+            return
+        
+        self._end_export()
         
         QMessageBox.critical(
             self,
@@ -821,11 +1254,42 @@ class ContentView(QWidget):
             f"An error occurred during export:\n{error}"
         )
     
+    def _end_export(self):
+        """Hide the progress bar and re-enable the export buttons."""
+        self.progress_container.hide()
+        self.progress_bar.setRange(0, 100)
+        self._exporting = False
+        self._update_export_all_btn()
+        self._on_selection_changed()  # Re-enable selected button if applicable
+    
+    def _update_export_all_btn(self):
+        """Enable Export All unless an export is running or the category is loading."""
+        self.export_all_btn.setEnabled(not self._exporting and not self._loading)
+    
+    def _stop_export(self):
+        """Cancel the running export and wait for it to stop, without reporting it."""
+        worker, self._export_worker = self._export_worker, None
+        if worker is None:
+            return
+        
+        # A cancelled worker still emits finished, which must not be shown
+        # as a completed export
+        for signal in (worker.finished, worker.error, getattr(worker, "progress", None)):
+            if signal is not None:
+                try:
+                    signal.disconnect()
+                except TypeError:  # Nothing connected
+                    pass
+        worker.cancel()
+        worker.wait()
+        self._end_export()
+    
     def cleanup(self):
         """Clean up resources."""
-        if self._export_worker:
-            self._export_worker.cancel()
-            self._export_worker.wait()
+        self._stop_export()
+        
+        self._cancel_loading()
+        self._wait_for_loads()
         
         if self._parser:
             self._parser.close()
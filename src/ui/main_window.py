@@ -7,7 +7,7 @@ from typing import Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-    QSplitter, QMenuBar, QMenu, QMessageBox
+    QSplitter, QMenuBar, QMenu, QMessageBox, QApplication
 )
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QAction, QKeySequence
@@ -16,6 +16,7 @@ from .sidebar import Sidebar
 from .content_view import ContentView
 from .preview_panel import PreviewPanel
 from .styles import apply_stylesheet, is_dark_mode
+from ..core.data_extractors.camera_roll import MediaFile
 from ..utils.constants import APP_NAME, APP_VERSION, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT
 
 
@@ -146,7 +147,7 @@ class MainWindow(QMainWindow):
         
         # Content view signals
         self.content_view.export_finished.connect(self._on_export_finished)
-        self.content_view.table.itemSelectionChanged.connect(self._on_file_selected)
+        self.content_view.selection_changed.connect(self._on_file_selected)
     
     def _on_backup_selected(self, path: Path):
         """Handle backup selection from sidebar."""
@@ -162,12 +163,14 @@ class MainWindow(QMainWindow):
     
     def _set_mode(self, mode: str):
         """Set the application mode (lite or pro)."""
-        self._current_mode = mode
-        
-        # Update menu checkmarks
+        # Update menu checkmarks (re-choosing the current mode unchecks it)
         self.lite_mode_action.setChecked(mode == "lite")
         self.pro_mode_action.setChecked(mode == "pro")
         
+        if mode == self._current_mode:
+            return
+        self._current_mode = mode
+        
         # Show/hide preview panel based on mode
         self.preview_panel.setVisible(mode == "pro")
         
@@ -175,7 +178,6 @@ class MainWindow(QMainWindow):
         self.content_view.set_mode(mode)
         
         # Refresh stylesheet if needed
-        from PyQt6.QtWidgets import QApplication
         apply_stylesheet(QApplication.instance(), mode)
     
     def _on_file_selected(self):
@@ -183,16 +185,11 @@ class MainWindow(QMainWindow):
         if self._current_mode != "pro":
             return
         
-        selected_items = self.content_view.table.selectedItems()
-        if selected_items:
-            # Get the first column item of the first selected row
-            row = selected_items[0].row()
-            item = self.content_view.table.item(row, 0)
-            if item:
-                from ..core.data_extractors.camera_roll import MediaFile
-                media = item.data(Qt.ItemDataRole.UserRole)
-                if isinstance(media, MediaFile):
-                    self.preview_panel.set_file(media)
+        selected = self.content_view.table.selectionModel().selectedRows()
+        if selected:
+            media = selected[0].data(Qt.ItemDataRole.UserRole)
+            if isinstance(media, MediaFile):
+                self.preview_panel.set_file(media)
         else:
             self.preview_panel.clear()
     
@@ -24,6 +24,39 @@ class PermissionDialog(QDialog):
     Shows instructions and provides a button to open System Settings.
     """
     
+    # One stylesheet for the whole dialog, parsed once
+    _STYLE = """
+        QLabel#permissionIcon {
+            font-size: 48px;
+        }
+        QLabel#permissionMessage {
+            color: #888;
+            font-size: 13px;
+        }
+        QFrame#permissionSteps, QFrame#permissionSteps QFrame {
+            background-color: rgba(0, 122, 255, 0.1);
+            border-radius: 10px;
+            padding: 15px;
+        }
+        QFrame#permissionSteps QLabel {
+            font-size: 12px;
+        }
+        QPushButton#browseButton {
+            padding: 10px 20px;
+        }
+        QPushButton#primaryButton {
+            background-color: #007AFF;
+            color: white;
+            border: none;
+            border-radius: 8px;
+            padding: 10px 20px;
+            font-weight: 600;
+        }
+        QPushButton#primaryButton:hover {
+            background-color: #0066DD;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Permission Required")
@@ -34,13 +67,15 @@ class PermissionDialog(QDialog):
     
     def _setup_ui(self):
         """Set up the dialog UI."""
+        self.setStyleSheet(self._STYLE)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
         
         # Icon
         icon_label = QLabel("🔒")
-        icon_label.setStyleSheet("font-size: 48px;")
+        icon_label.setObjectName("permissionIcon")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(icon_label)
         
@@ -61,18 +96,12 @@ class PermissionDialog(QDialog):
         )
         message.setWordWrap(True)
         message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message.setStyleSheet("color: #888; font-size: 13px;")
+        message.setObjectName("permissionMessage")
         layout.addWidget(message)
         
         # Instructions
         instructions = QFrame()
-        instructions.setStyleSheet("""
-            QFrame {
-                background-color: rgba(0, 122, 255, 0.1);
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        instructions.setObjectName("permissionSteps")
         inst_layout = QVBoxLayout(instructions)
         inst_layout.setSpacing(8)
         
@@ -86,7 +115,6 @@ class PermissionDialog(QDialog):
         
         for step in steps:
             step_label = QLabel(step)
-            step_label.setStyleSheet("font-size: 12px;")
             inst_layout.addWidget(step_label)
         
         layout.addWidget(instructions)
@@ -96,8 +124,8 @@ class PermissionDialog(QDialog):
         button_layout.setSpacing(12)
         
         browse_btn = QPushButton("Browse Custom Folder")
+        browse_btn.setObjectName("browseButton")
         browse_btn.clicked.connect(self._on_browse)
-        browse_btn.setStyleSheet("padding: 10px 20px;")
         button_layout.addWidget(browse_btn)
         
         button_layout.addStretch()
@@ -105,19 +133,6 @@ class PermissionDialog(QDialog):
         settings_btn = QPushButton("Open System Settings")
         settings_btn.setObjectName("primaryButton")
         settings_btn.clicked.connect(self._open_settings)
-        settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #0066DD;
-            }
-        """)
         button_layout.addWidget(settings_btn)
         
         layout.addLayout(button_layout)
@@ -139,7 +154,7 @@ class PermissionDialog(QDialog):
                     "open", 
                     "/System/Applications/System Settings.app"
                 ], check=False)
-            except:
+            except OSError:
                 pass
         
         self.accept()
@@ -8,11 +8,63 @@ from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QScrollArea, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtCore import Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QPixmap, QImage, QImageReader
 
 from ..core.data_extractors.camera_roll import MediaFile
-from ..utils.constants import IMAGE_EXTENSIONS
+from ..utils.constants import IMAGE_EXTENSIONS, PREVIEW_RESIZE_DELAY_MS
+
+
+class _PreviewSignals(QObject):
+    """Carries decoded previews from the thread pool to the GUI thread."""
+    
+    ready = pyqtSignal(int, QImage, str)  # decode generation, image, error message
+
+
+class _PreviewTask(QRunnable):
+    """Decode one preview image on a pool thread."""
+    
+    def __init__(self, generation: int, media_file: MediaFile, max_width: int, signals: _PreviewSignals):
+        super().__init__()
+        self.generation = generation
+        self.media_file = media_file
+        self.max_width = max_width
+        self.signals = signals
+    
+    def run(self):
+        # QImage (unlike QPixmap) is safe to build off the GUI thread
+        try:
+            path = str(self.media_file.source_path)
+            image = self._read(QImageReader(path))
+            
+            if image.isNull():
+                # Backup files have no extension, so the format above was
+                # guessed from the content; retry as the original file's
+                # format (still streamed from disk, not read into memory)
+                image = self._read(QImageReader(path, self.media_file.extension[1:].encode()))
+            
+            # A photo rotated by its EXIF orientation can still be wider
+            # than the panel
+            if image.width() > self.max_width:
+                image = image.scaledToWidth(
+                    self.max_width,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            self.signals.ready.emit(self.generation, image, "")
+        except Exception as e:
+            self.signals.ready.emit(self.generation, QImage(), str(e))
+    
+    def _read(self, reader: QImageReader) -> QImage:
+        """Read an image, decoding it at no more than max_width wide."""
+        # Decoding at panel width lets JPEG/HEIF skip most of the work
+        # (and memory) of a full sensor-resolution image
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and size.width() > self.max_width:
+            reader.setScaledSize(
+                size.scaled(self.max_width, size.height(), Qt.AspectRatioMode.KeepAspectRatio)
+            )
+        return reader.read()
 
 
 class PreviewPanel(QWidget):
@@ -22,6 +74,23 @@ class PreviewPanel(QWidget):
     Used in Pro mode to show a preview of selected files.
     """
     
+    # Parsed once; each preview state just switches the "state" property
+    _IMAGE_LABEL_STYLE = """
+        QLabel#previewImage {
+            background-color: rgba(0, 0, 0, 0.05);
+            border-radius: 8px;
+            padding: 20px;
+            color: #888;
+            font-size: 13px;
+        }
+        QLabel#previewImage[state="image"] {
+            padding: 8px;
+        }
+        QLabel#previewImage[state="video"] {
+            font-size: 12px;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("previewPanel")
@@ -29,6 +98,22 @@ class PreviewPanel(QWidget):
         self.setMaximumWidth(400)
         
         self._current_file: Optional[MediaFile] = None
+        # Decoded image for the current file, capped to the panel width,
+        # so resizes only rescale it instead of decoding the file again
+        self._source_pixmap: Optional[QPixmap] = None
+        self._source_path: Optional[Path] = None
+        
+        # Images are decoded on the global thread pool; results for a file
+        # that is no longer selected carry an old generation and are dropped
+        self._decode_generation = 0
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.ready.connect(self._on_preview_decoded)
+        
+        # Rescale once a resize (e.g. a splitter drag) settles, not per pixel
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(PREVIEW_RESIZE_DELAY_MS)
+        self._resize_timer.timeout.connect(self._rescale_preview)
         
         self._setup_ui()
     
@@ -49,13 +134,10 @@ class PreviewPanel(QWidget):
         preview_layout.setContentsMargins(0, 0, 0, 0)
         
         self.image_label = QLabel()
+        self.image_label.setObjectName("previewImage")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setMinimumHeight(200)
-        self.image_label.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 0.1);
-            border-radius: 8px;
-            padding: 8px;
-        """)
+        self.image_label.setStyleSheet(self._IMAGE_LABEL_STYLE)
         self.image_label.setSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Expanding
@@ -93,13 +175,7 @@ class PreviewPanel(QWidget):
     def _show_empty_state(self):
         """Show empty state when no file is selected."""
         self.image_label.setText("📷\n\nSelect a file\nto preview")
-        self.image_label.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 0.05);
-            border-radius: 8px;
-            padding: 20px;
-            color: #888;
-            font-size: 13px;
-        """)
+        self._set_image_state("empty")
         self.filename_label.setText("No file selected")
         self.details_label.setText("")
     
@@ -111,6 +187,9 @@ class PreviewPanel(QWidget):
             media_file: MediaFile to preview, or None to clear
         """
         self._current_file = media_file
+        self._source_pixmap = None
+        self._source_path = None
+        self._decode_generation += 1
         
         if not media_file:
             self._show_empty_state()
@@ -138,62 +217,97 @@ class PreviewPanel(QWidget):
     def _load_image_preview(self, media_file: MediaFile):
         """Load and display image preview."""
         try:
-            if not media_file.exists():
-                self.image_label.setText("📷\n\nFile not found")
+            # Decode the file only once, in the background; later calls
+            # rescale the cached copy
+            if media_file.source_path != self._source_path:
+                self._source_path = media_file.source_path
+                self._source_pixmap = None
+                
+                if not media_file.exists():
+                    self.image_label.setText("📷\n\nFile not found")
+                    return
+                
+                self.image_label.setText("📷\n\nLoading preview...")
+                QThreadPool.globalInstance().start(_PreviewTask(
+                    self._decode_generation,
+                    media_file,
+                    self.maximumWidth(),
+                    self._preview_signals
+                ))
                 return
             
-            # Load image
-            pixmap = QPixmap(str(media_file.source_path))
-            
-            if pixmap.isNull():
-                # Try loading as raw data
-                data = media_file.get_preview_data(max_size=5 * 1024 * 1024)
-                if data:
-                    image = QImage()
-                    if image.loadFromData(data):
-                        pixmap = QPixmap.fromImage(image)
-            
-            if pixmap.isNull():
-                self.image_label.setText("📷\n\nCannot preview\nthis format")
+            # A file still decoding, or that couldn't be, keeps its message
+            if self._source_pixmap is None:
                 return
             
-            # Scale to fit
-            scaled = pixmap.scaled(
-                self.image_label.size() - QSize(20, 20),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            self.image_label.setPixmap(scaled)
-            self.image_label.setStyleSheet("""
-                background-color: rgba(0, 0, 0, 0.05);
-                border-radius: 8px;
-                padding: 8px;
-            """)
+            self._show_source_pixmap()
             
         except Exception as e:
             self.image_label.setText(f"📷\n\nPreview error:\n{str(e)[:50]}")
     
+    @pyqtSlot(int, QImage, str)
+    def _on_preview_decoded(self, generation: int, image: QImage, error: str):
+        """Show a decoded preview, unless another file was selected since."""
+        if generation != self._decode_generation:
+            return
+        
+        if error:
+            self.image_label.setText(f"📷\n\nPreview error:\n{error[:50]}")
+            return
+        if image.isNull():
+            self.image_label.setText("📷\n\nCannot preview\nthis format")
+            return
+        
+        self._source_pixmap = QPixmap.fromImage(image)
+        self._show_source_pixmap()
+    
+    def _show_source_pixmap(self):
+        """Scale the decoded image to fit the preview area."""
+        # Scale to fit
+        scaled = self._source_pixmap.scaled(
+            self.image_label.size() - QSize(20, 20),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        
+        self.image_label.setPixmap(scaled)
+        self._set_image_state("image")
+    
     def _show_video_placeholder(self, media_file: MediaFile):
         """Show placeholder for video files."""
         self.image_label.setText(f"🎬\n\n{media_file.filename}\n\nVideo preview\nnot available")
-        self.image_label.setStyleSheet("""
-            background-color: rgba(0, 0, 0, 0.05);
-            border-radius: 8px;
-            padding: 20px;
-            color: #888;
-            font-size: 12px;
-        """)
+        self._set_image_state("video")
+    
+    def _set_image_state(self, state: str):
+        """
+        Switch the image label's style.
+        
+        Args:
+            state: "empty", "image" or "video" (see _IMAGE_LABEL_STYLE)
+        """
+        if self.image_label.property("state") == state:
+            return
+        self.image_label.setProperty("state", state)
+        
+        # Re-apply the already parsed stylesheet for the new property value
+        style = self.image_label.style()
+        style.unpolish(self.image_label)
+        style.polish(self.image_label)
     
     def clear(self):
         """Clear the preview."""
         self._current_file = None
+        self._source_pixmap = None
+        self._source_path = None
+        self._decode_generation += 1
         self._show_empty_state()
     
     def resizeEvent(self, event):
         """Handle resize to update image scaling."""
         super().resizeEvent(event)
-        
-        # Re-scale image if one is displayed
+        self._resize_timer.start()
+    
+    def _rescale_preview(self):
+        """Re-scale the displayed image to the new size (from the cached copy)."""
         if self._current_file and self._current_file.is_image:
             self._load_image_preview(self._current_file)
@@ -6,6 +6,8 @@ system theme (light/dark mode) while adding custom styling for
 the iOS Backup Explorer.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette, QColor
 from PyQt6.QtCore import Qt
@@ -173,7 +175,7 @@ def get_stylesheet() -> str:
     }}
     
     /* ===== Table View ===== */
-    QTableWidget {{
+    QTableView {{
         background-color: {surface};
         border: 1px solid {border};
         border-radius: 10px;
@@ -182,12 +184,12 @@ def get_stylesheet() -> str:
         outline: none;
     }}
     
-    QTableWidget::item {{
+    QTableView::item {{
         padding: 8px 12px;
         border-bottom: 1px solid {border};
     }}
     
-    QTableWidget::item:selected {{
+    QTableView::item:selected {{
         background-color: {accent};
         color: white;
     }}
@@ -286,7 +288,22 @@ def get_pro_mode_additions() -> str:
     return ""
 
 
-def apply_stylesheet(app: QApplication, mode: str = "pro"):
+@lru_cache(maxsize=4)
+def _build_stylesheet(mode: str, dark: bool, accent: str) -> str:
+    """
+    Build the full stylesheet for a mode.
+    
+    dark and accent aren't used directly (get_stylesheet reads the same
+    palette); they key the cache so a theme change builds a new sheet.
+    """
     base = get_stylesheet()
     extra = get_lite_mode_additions() if mode == "lite" else get_pro_mode_additions()
-    app.setStyleSheet(base + extra)
+    return base + extra
+
+
+def apply_stylesheet(app: QApplication, mode: str = "pro"):
+    stylesheet = _build_stylesheet(mode, is_dark_mode(), get_accent_color())
+    
+    # Setting a stylesheet re-polishes every widget, even if it's unchanged
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
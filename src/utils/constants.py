@@ -59,10 +59,20 @@ SIDEBAR_WIDTH = 250
 PREVIEW_PANEL_WIDTH = 300
 MIN_WINDOW_WIDTH = 1200
 MIN_WINDOW_HEIGHT = 700
+PROGRESS_UPDATE_INTERVAL = 0.05  # Seconds between progress signals from workers
+STATS_UPDATE_INTERVAL = 0.5  # Seconds between export speed/ETA recalculations
+LOAD_BATCH_SIZE = 500  # Rows per batch streamed into the file table
+THUMBNAIL_SIZE = 24  # Camera Roll row thumbnails (px), fits the default row height
+PREVIEW_RESIZE_DELAY_MS = 50  # Preview rescale delay after the panel stops resizing
 
 # Export settings
 DEFAULT_EXPORT_FOLDER = Path.home() / "Desktop" / "iOS_Export"
 CHUNK_SIZE = 1024 * 1024  # 1MB for file copying
+EXPORT_MAX_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # Parallel file writes during export
+EXPORT_WORKERS_ENV = "IOSBACKUPEXPLORER_EXPORT_WORKERS"  # Overrides EXPORT_MAX_WORKERS
+
+# Parser settings
+FILES_CACHE_MAX_DOMAINS = 8  # Per-domain file lists kept in memory
 
 # Data type display info
 DATA_TYPES = {
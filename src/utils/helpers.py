@@ -1,11 +1,15 @@
 """Helper utilities for iOS Backup Explorer."""
 
 import os
+import re
 import hashlib
 import plistlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Iterable
+
+from .constants import EXPORT_MAX_WORKERS, EXPORT_WORKERS_ENV
 
 
 def get_file_hash(domain: str, relative_path: str) -> str:
@@ -90,6 +94,10 @@ def get_file_extension(filename: str) -> str:
     return Path(filename).suffix.lower()
 
 
+# Anything outside ASCII letters/digits and ._- ()[] is replaced in filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._\- ()\[\]]")
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename to prevent directory traversal and invalid chars.
@@ -108,8 +116,7 @@ def sanitize_filename(filename: str) -> str:
     
     # Replace potentially dangerous characters
     # Keep alphanumeric, dot, dash, underscore, space, parenthesis
-    safe_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._- ()[]")
-    clean_name = "".join(c if c in safe_chars else "_" for c in filename)
+    clean_name = _UNSAFE_FILENAME_CHARS.sub("_", filename)
     
     # Ensure it's not empty or just dots
     if not clean_name or set(clean_name) == {'.'}:
@@ -183,8 +190,10 @@ def check_backup_access() -> tuple[bool, str]:
         return True, "Backup directory does not exist yet"
     
     try:
-        # Try to list the directory
-        list(DEFAULT_BACKUP_PATH.iterdir())
+        # Opening the directory is what Full Disk Access guards, so there's
+        # no need to read every entry
+        with os.scandir(DEFAULT_BACKUP_PATH):
+            pass
         return True, "Access granted"
     except PermissionError:
         return False, (
@@ -253,3 +262,55 @@ def ensure_dir(path: Path) -> Path:
     """
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def get_export_workers() -> int:
+    """
+    Get the number of files to write in parallel during exports.
+    
+    Returns:
+        EXPORT_MAX_WORKERS, unless overridden by the EXPORT_WORKERS_ENV
+        environment variable (useful for slow network destinations)
+    """
+    try:
+        return max(1, int(os.environ[EXPORT_WORKERS_ENV]))
+    except (KeyError, ValueError):
+        return EXPORT_MAX_WORKERS
+
+
+def export_unique_files(
+    items: Iterable[Any],
+    filename_func: Callable[[Any], str],
+    write_func: Callable[[Any, str], bool],
+) -> int:
+    """
+    Write items to their own files in parallel, one write per filename.
+    
+    Items whose filenames collide would overwrite each other, so only the
+    last one per name is written (but all are counted). Names are compared
+    casefolded: the default macOS filesystem is case-insensitive, and two
+    threads must never write the same file.
+    
+    Args:
+        items: Records to export
+        filename_func: Returns an item's (sanitized) filename
+        write_func: Writes an item to the given filename, returning success
+        
+    Returns:
+        Number of items exported
+    """
+    groups: Dict[str, List[Any]] = {}
+    filenames: Dict[str, str] = {}
+    for item in items:
+        filename = filename_func(item)
+        key = filename.casefold()
+        groups.setdefault(key, []).append(item)
+        filenames[key] = filename  # Named after the item that gets written
+    
+    with ThreadPoolExecutor(max_workers=get_export_workers()) as executor:
+        results = executor.map(
+            write_func,
+            [group[-1] for group in groups.values()],
+            filenames.values(),
+        )
+        return sum(len(group) for group, ok in zip(groups.values(), results) if ok)